@@ -0,0 +1,239 @@
+"""Animations GIF et APNG ecrites au fil des images, sans programme externe
+    Toutes les images partagent une palette (celle de framebuffer) :
+    pas de quantification, chaque image n'est que la table d'indices.
+    Apres la premiere image on n'ecrit que le rectangle qui a change,
+    les pixels inchanges du rectangle etant transparents"""
+
+#Librairies standards de Python
+import struct
+import zlib
+
+#Librairies externes
+import numpy as np
+
+#Module crée
+import framebuffer
+
+PALETTE = np.array([framebuffer.COULEUR_BACKGROUND, framebuffer.COULEUR_CERCLE,
+                    framebuffer.COULEUR_HORS_CERCLE, framebuffer.COULEUR], dtype=np.uint8)
+
+
+def indexer(image, palette=PALETTE):
+    """Table (H, W) des indices dans palette des pixels d'une image (H, W, 3)"""
+    cles_palette = palette.astype(np.uint32) @ np.array([1 << 16, 1 << 8, 1], dtype=np.uint32)
+    ordre = np.argsort(cles_palette)
+    cles = image.astype(np.uint32) @ np.array([1 << 16, 1 << 8, 1], dtype=np.uint32)
+    rangs = np.searchsorted(cles_palette[ordre], cles)
+    rangs = np.minimum(rangs, len(palette) - 1, out=rangs)
+    if not np.array_equal(cles_palette[ordre][rangs], cles):
+        raise ValueError("l'image contient une couleur absente de la palette")
+    return ordre[rangs].astype(np.uint8)
+
+def rectangle_modifie(precedente, indices):
+    """(ligne1, ligne2, col1, col2) du plus petit rectangle contenant les pixels modifies,
+    None si rien n'a change"""
+    modifies = precedente != indices
+    lignes = np.flatnonzero(modifies.any(axis=1))
+    if len(lignes) == 0:
+        return None
+    colonnes = np.flatnonzero(modifies.any(axis=0))
+    return lignes[0], lignes[-1] + 1, colonnes[0], colonnes[-1] + 1
+
+def _delta(precedente, indices, transparent):
+    """(ligne, colonne, indices) du rectangle modifie, pixels inchanges a transparent"""
+    rectangle = rectangle_modifie(precedente, indices)
+    if rectangle is None: #Une image vide d'un pixel suffit
+        return 0, 0, np.full((1, 1), transparent, dtype=np.uint8)
+    ligne1, ligne2, col1, col2 = rectangle
+    morceau = indices[ligne1:ligne2, col1:col2].copy()
+    morceau[precedente[ligne1:ligne2, col1:col2] == morceau] = transparent
+    return ligne1, col1, morceau
+
+
+def lzw_gif(donnees, taille_code_min):
+    """Compression LZW d'une suite d'indices (bytes) au format GIF, en sous-blocs"""
+    effacer = 1 << taille_code_min
+    fin = effacer + 1
+    sortie = bytearray()
+    bits, nbr_bits = 0, 0
+
+    def emettre(code, largeur):
+        nonlocal bits, nbr_bits
+        bits |= code << nbr_bits
+        nbr_bits += largeur
+        while nbr_bits >= 8:
+            sortie.append(bits & 0xff)
+            bits >>= 8
+            nbr_bits -= 8
+
+    table, suivant, largeur = {}, fin + 1, taille_code_min + 1
+    emettre(effacer, largeur)
+    courant = None
+    for octet in donnees:
+        if courant is None:
+            courant = octet
+            continue
+        cle = courant << 8 | octet
+        code = table.get(cle)
+        if code is not None:
+            courant = code
+            continue
+        emettre(courant, largeur)
+        if suivant == 4096: #Table pleine : on repart de zero
+            emettre(effacer, largeur)
+            table, suivant, largeur = {}, fin + 1, taille_code_min + 1
+        else:
+            table[cle] = suivant
+            if suivant == 1 << largeur:
+                largeur += 1
+            suivant += 1
+        courant = octet
+    if courant is not None:
+        emettre(courant, largeur)
+    emettre(fin, largeur)
+    if nbr_bits:
+        sortie.append(bits & 0xff)
+    blocs = bytearray()
+    for debut in range(0, len(sortie), 255):
+        morceau = sortie[debut:debut + 255]
+        blocs.append(len(morceau))
+        blocs += morceau
+    blocs.append(0)
+    return bytes(blocs)
+
+
+class AnimationGif:
+    """
+    GIF anime ecrit image par image dans un fichier binaire ouvert
+    (fichier disque ou io.BytesIO).
+
+    with open("pi.gif", "wb") as fichier, AnimationGif(fichier, 400, 400) as gif:
+        for image in images:
+            gif.ajouter(image)
+
+    delai est en centiemes de seconde, boucle=0 pour une boucle infinie.
+    Le dernier indice de la palette (completee a une puissance de 2)
+    sert de couleur transparente pour les images delta.
+    """
+    def __init__(self, fichier, largeur, hauteur, palette=PALETTE, delai=100, boucle=0):
+        self.fichier, self.largeur, self.hauteur = fichier, largeur, hauteur
+        self.palette, self.delai = palette, delai
+        self.taille_code_min = max(2, int(len(palette)).bit_length())
+        self.transparent = len(palette)
+        self.precedente = None
+        table = np.zeros((1 << self.taille_code_min, 3), dtype=np.uint8)
+        table[:len(palette)] = palette
+        fichier.write(b"GIF89a")
+        fichier.write(struct.pack("<HHBBB", largeur, hauteur,
+                                  0xf0 | (self.taille_code_min - 1), 0, 0))
+        fichier.write(table.tobytes())
+        fichier.write(b"\x21\xff\x0bNETSCAPE2.0\x03\x01" + struct.pack("<H", boucle) + b"\x00")
+
+    def ajouter(self, image):
+        """Ajoute une image (H, W, 3) aux couleurs de la palette"""
+        indices = indexer(image, self.palette)
+        if self.precedente is None:
+            ligne, colonne, morceau = 0, 0, indices
+        else:
+            ligne, colonne, morceau = _delta(self.precedente, indices, self.transparent)
+        self.precedente = indices
+        #Extension de controle : on garde l'image precedente, transparence active
+        self.fichier.write(b"\x21\xf9\x04" + struct.pack("<BHBB", 0x05, self.delai,
+                                                         self.transparent, 0))
+        self.fichier.write(b"\x2c" + struct.pack("<HHHHB", colonne, ligne,
+                                                 morceau.shape[1], morceau.shape[0], 0))
+        self.fichier.write(bytes([self.taille_code_min]))
+        self.fichier.write(lzw_gif(morceau.tobytes(), self.taille_code_min))
+
+    def fermer(self):
+        """Termine le fichier"""
+        self.fichier.write(b"\x3b")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exception):
+        self.fermer()
+
+
+def _bloc_png(nom, donnees):
+    """Chunk PNG : taille, nom, donnees, crc"""
+    return (struct.pack(">I", len(donnees)) + nom + donnees
+            + struct.pack(">I", zlib.crc32(nom + donnees)))
+
+
+class AnimationApng:
+    """
+    PNG anime (APNG) ecrit image par image, meme interface que AnimationGif.
+    Les lignes sont compressees par zlib. Le nombre d'images n'est connu qu'a la fin :
+    le fichier doit permettre de revenir en arriere (seek) pour le completer.
+    """
+    def __init__(self, fichier, largeur, hauteur, palette=PALETTE, delai=100, boucle=0):
+        self.fichier, self.largeur, self.hauteur = fichier, largeur, hauteur
+        self.palette, self.delai, self.boucle = palette, delai, boucle
+        self.transparent = len(palette)
+        self.precedente = None
+        self.nombre, self.sequence = 0, 0
+        table = np.zeros((len(palette) + 1, 3), dtype=np.uint8)
+        table[:len(palette)] = palette
+        alpha = bytes([255]*len(palette) + [0])
+        fichier.write(b"\x89PNG\r\n\x1a\n")
+        fichier.write(_bloc_png(b"IHDR", struct.pack(">IIBBBBB", largeur, hauteur, 8, 3, 0, 0, 0)))
+        fichier.write(_bloc_png(b"PLTE", table.tobytes()))
+        fichier.write(_bloc_png(b"tRNS", alpha))
+        self.position_actl = fichier.tell()
+        fichier.write(_bloc_png(b"acTL", struct.pack(">II", 0, boucle)))
+
+    def ajouter(self, image):
+        """Ajoute une image (H, W, 3) aux couleurs de la palette"""
+        indices = indexer(image, self.palette)
+        if self.precedente is None:
+            ligne, colonne, morceau, melange = 0, 0, indices, 0
+        else:
+            ligne, colonne, morceau = _delta(self.precedente, indices, self.transparent)
+            melange = 1 #Les pixels transparents laissent voir l'image precedente
+        self.precedente = indices
+        self.fichier.write(_bloc_png(b"fcTL", struct.pack(
+            ">IIIIIHHBB", self.sequence, morceau.shape[1], morceau.shape[0],
+            colonne, ligne, self.delai, 100, 0, melange)))
+        self.sequence += 1
+        lignes = np.zeros((morceau.shape[0], morceau.shape[1] + 1), dtype=np.uint8)
+        lignes[:, 1:] = morceau #Filtre 0 devant chaque ligne
+        donnees = zlib.compress(lignes.tobytes())
+        if self.nombre == 0:
+            self.fichier.write(_bloc_png(b"IDAT", donnees))
+        else:
+            self.fichier.write(_bloc_png(b"fdAT", struct.pack(">I", self.sequence) + donnees))
+            self.sequence += 1
+        self.nombre += 1
+
+    def fermer(self):
+        """Termine le fichier et y inscrit le nombre d'images"""
+        self.fichier.write(_bloc_png(b"IEND", b""))
+        fin = self.fichier.tell()
+        self.fichier.seek(self.position_actl)
+        self.fichier.write(_bloc_png(b"acTL", struct.pack(">II", self.nombre, self.boucle)))
+        self.fichier.seek(fin)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exception):
+        self.fermer()
+
+
+FORMATS = {".gif": AnimationGif, ".png": AnimationApng, ".apng": AnimationApng}
+
+def ecrire_animation(filename, images, delai=100):
+    """Ecrit les images (iterable de tableaux (H, W, 3)) au fur et a mesure
+    dans un GIF ou un APNG selon l'extension de filename"""
+    extension = filename[filename.rfind("."):].lower()
+    if extension not in FORMATS:
+        raise ValueError(f"format inconnu : {filename} (extensions : {', '.join(FORMATS)})")
+    images = iter(images)
+    premiere = next(images)
+    with open(filename, "wb") as fichier, FORMATS[extension](
+            fichier, premiere.shape[1], premiere.shape[0], delai=delai) as animation:
+        animation.ajouter(premiere)
+        for image in images:
+            animation.ajouter(image)
@@ -8,7 +8,16 @@
 #Librairies standards de Python
 from random import uniform
 from sys import argv
+from os import cpu_count
+from multiprocessing import Pool
+from math import sqrt, isqrt
+import warnings
+from statistics import NormalDist
 
+#Librairies externes
+import numpy as np
+
+TAILLE_BLOC = 1 << 18 #Nombre de points tires a la fois par le moteur numpy
 
 
 def generer_iterateur_points(nbr_de_points):
@@ -28,15 +37,176 @@ def approximation(nbr_de_points):
             compteur += 1
     return 4*(compteur/nbr_de_points)
 
+def compter_par_blocs(nbr_de_points, generateur=None, taille_bloc=TAILLE_BLOC):
+    """Nombre de points dans le cercle parmi nbr_de_points, tires par blocs numpy
+    La memoire utilisee ne depend que de taille_bloc.
+    On tire dans [0, 1[ (quart de cercle, meme proportion) en float32 :
+    l'erreur d'arrondi au bord du cercle est tres inferieure a l'erreur statistique"""
+    if generateur is None:
+        generateur = np.random.default_rng()
+    tampon = np.empty(2*taille_bloc, dtype=np.float32)
+    compteur = 0
+    for debut in range(0, nbr_de_points, taille_bloc):
+        taille = min(taille_bloc, nbr_de_points - debut)
+        bloc = tampon[:2*taille] #x dans la premiere moitie, y dans la seconde
+        generateur.random(out=bloc, dtype=np.float32)
+        np.square(bloc, out=bloc)
+        np.add(bloc[:taille], bloc[taille:], out=bloc[:taille])
+        compteur += int(np.count_nonzero(bloc[:taille] <= 1))
+    return compteur
+
+def approximation_par_blocs(nbr_de_points, generateur=None, taille_bloc=TAILLE_BLOC):
+    """Approxime pi avec le moteur par blocs"""
+    return 4*(compter_par_blocs(nbr_de_points, generateur, taille_bloc)/nbr_de_points)
+
+def intervalle_confiance(compteur, nbr_de_points, confiance=0.95):
+    """Intervalle de Wilson pour pi = 4*p, p proportion de points dans le cercle"""
+    z = NormalDist().inv_cdf((1 + confiance)/2)
+    proportion = compteur/nbr_de_points
+    centre = (proportion + z*z/(2*nbr_de_points))/(1 + z*z/nbr_de_points)
+    rayon = z*sqrt(proportion*(1 - proportion)/nbr_de_points
+                   + z*z/(4*nbr_de_points*nbr_de_points))/(1 + z*z/nbr_de_points)
+    return 4*(centre - rayon), 4*(centre + rayon)
+
+def estimations_en_continu(nbr_max, pas=TAILLE_BLOC, confiance=0.95, generateur=None):
+    """Generer (points tires, estimation, intervalle de confiance) tous les pas points"""
+    if generateur is None:
+        generateur = np.random.default_rng()
+    compteur, nbr_de_points = 0, 0
+    taille_bloc = min(pas, TAILLE_BLOC) #tampon a la taille du pas s'il est petit
+    while nbr_de_points < nbr_max:
+        etape = min(pas, nbr_max - nbr_de_points)
+        compteur += compter_par_blocs(etape, generateur, taille_bloc)
+        nbr_de_points += etape
+        yield (nbr_de_points, 4*(compteur/nbr_de_points),
+               intervalle_confiance(compteur, nbr_de_points, confiance))
+
+def approximation_precision(largeur, nbr_max, pas=TAILLE_BLOC, confiance=0.95, generateur=None):
+    """Approxime pi en s'arretant des que l'intervalle de confiance est plus etroit que largeur
+    Retourne (estimation, points tires, points economises par rapport a nbr_max),
+    l'estimation est nan si aucun point n'est tire"""
+    #Avant le premier bloc : aucun point, intervalle [0, 4] sans information
+    nbr_de_points, estimation, (bas, haut) = 0, float("nan"), (0.0, 4.0)
+    for nbr_de_points, estimation, (bas, haut) in estimations_en_continu(
+            nbr_max, pas, confiance, generateur):
+        if haut - bas < largeur:
+            break
+    return estimation, nbr_de_points, nbr_max - nbr_de_points
+
+def _blocs_aleatoires(nbr_de_points, generateur, taille_bloc):
+    """Points pseudo-aleatoires uniformes"""
+    for debut in range(0, nbr_de_points, taille_bloc):
+        yield generateur.random((min(taille_bloc, nbr_de_points - debut), 2))
+
+def _blocs_halton(nbr_de_points, generateur, taille_bloc):
+    """Suite de Halton (bases 2 et 3) brouillee"""
+    from scipy.stats import qmc
+    suite = qmc.Halton(2, seed=generateur)
+    for debut in range(0, nbr_de_points, taille_bloc):
+        yield suite.random(min(taille_bloc, nbr_de_points - debut))
+
+def _blocs_sobol(nbr_de_points, generateur, taille_bloc):
+    """Suite de Sobol brouillee, equilibree pour nbr_de_points puissance de 2"""
+    from scipy.stats import qmc
+    suite = qmc.Sobol(2, seed=generateur)
+    for debut in range(0, nbr_de_points, taille_bloc):
+        #Filtre limite au tirage : autour du yield il resterait actif chez l'appelant
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", UserWarning) #avertissement si n n'est pas 2^m
+            bloc = suite.random(min(taille_bloc, nbr_de_points - debut))
+        yield bloc
+
+def _blocs_stratifies(nbr_de_points, generateur, taille_bloc):
+    """Un point au hasard dans chaque case d'une grille k x k, k*k <= nbr_de_points
+    Les points restants sont tires uniformement"""
+    cote = isqrt(nbr_de_points)
+    lignes_par_bloc = max(1, taille_bloc // max(cote, 1))
+    colonnes = np.arange(cote)
+    for ligne in range(0, cote, lignes_par_bloc):
+        lignes = np.arange(ligne, min(ligne + lignes_par_bloc, cote))
+        cases = np.stack(np.meshgrid(colonnes, lignes), axis=-1).reshape(-1, 2)
+        yield (cases + generateur.random(cases.shape))/cote
+    yield from _blocs_aleatoires(nbr_de_points - cote*cote, generateur, taille_bloc)
+
+def _blocs_antithetiques(nbr_de_points, generateur, taille_bloc):
+    """Chaque point (x, y) est accompagne de (1-x, 1-y)
+    Le test du cercle est decroissant en x et y : les deux tirages sont
+    negativement correles et la variance de l'estimation diminue.
+    Un bloc de taille impaire garde un point sans son symetrique"""
+    for debut in range(0, nbr_de_points, taille_bloc):
+        taille = min(taille_bloc, nbr_de_points - debut)
+        moitie = generateur.random(((taille + 1)//2, 2))
+        yield np.concatenate((moitie, 1 - moitie))[:taille]
+
+MODES = {
+    "aleatoire": _blocs_aleatoires,
+    "halton": _blocs_halton,
+    "sobol": _blocs_sobol,
+    "stratifie": _blocs_stratifies,
+    "antithetique": _blocs_antithetiques,
+}
+
+def compter_mode(nbr_de_points, mode="aleatoire", generateur=None, taille_bloc=TAILLE_BLOC):
+    """Nombre de points dans le quart de cercle parmi nbr_de_points tires selon mode
+    (une cle de MODES)"""
+    if mode not in MODES:
+        raise ValueError(f"mode inconnu : {mode} (choisir parmi {', '.join(MODES)})")
+    if generateur is None:
+        generateur = np.random.default_rng()
+    compteur = 0
+    for bloc in MODES[mode](nbr_de_points, generateur, taille_bloc):
+        np.square(bloc, out=bloc)
+        compteur += int(np.count_nonzero(bloc[:, 0] + bloc[:, 1] <= 1))
+    return compteur
+
+def approximation_mode(nbr_de_points, mode="aleatoire", generateur=None):
+    """Approxime pi avec un echantillonnage de MODES"""
+    return 4*(compter_mode(nbr_de_points, mode, generateur)/nbr_de_points)
+
+def _compter_flux(arguments):
+    """Compte d'un processus : (nombre de points, graine propre au processus)"""
+    nbr_de_points, graine = arguments
+    return compter_par_blocs(nbr_de_points, np.random.default_rng(graine))
+
+def compter_parallele(nbr_de_points, graine=None, processus=None):
+    """Nombre de points dans le cercle, tires par processus independants
+    Chaque processus a son propre flux aleatoire (SeedSequence.spawn) :
+    pour une graine et un nombre de processus donnes le resultat est toujours le meme"""
+    processus = processus or cpu_count()
+    graines = np.random.SeedSequence(graine).spawn(processus)
+    parts = [nbr_de_points//processus + (k < nbr_de_points % processus) for k in range(processus)]
+    with Pool(processus) as pool:
+        #Somme d'entiers : reduction exacte quel que soit l'ordre
+        return sum(pool.map(_compter_flux, zip(parts, graines)))
+
+def approximation_parallele(nbr_de_points, graine=None, processus=None):
+    """Approxime pi sur plusieurs coeurs"""
+    return 4*(compter_parallele(nbr_de_points, graine, processus)/nbr_de_points)
+
 
 
 if __name__ == "__main__":
     try:
+        PRECISION = None
+        if len(argv) > 2 and argv[2].startswith("--precision="):
+            PRECISION = float(argv.pop(2)[len("--precision="):])
         N = int(argv[1])
         assert N > 0
-        print(approximation(N))
+        if PRECISION is not None:
+            ESTIMATION, TIRES, ECONOMISES = approximation_precision(PRECISION, N)
+            print(ESTIMATION, TIRES)
+            print(f"{ECONOMISES} points economises sur {N}")
+        elif len(argv) > 2:
+            PROCESSUS = int(argv[2])
+            GRAINE = int(argv[3]) if len(argv) > 3 else None
+            assert PROCESSUS > 0
+            print(approximation_parallele(N, GRAINE, PROCESSUS))
+        else:
+            print(approximation_par_blocs(N))
     except IndexError:
-        print("Il faut utiliser le script comme suit : ./approximate.py nombre_de_points")
+        print("Il faut utiliser le script comme suit : "
+              "./approximate.py nombre_de_points [processus [graine]]\n"
+              "       ./approximate.py nombre_de_points --precision=largeur")
     except ValueError:
         print("Il faut entrer un entier")
     except AssertionError:
@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+
+"""
+Temps par image de draw.py : moteur incremental (MoteurImages, sans ecriture)
+contre une image complete a chaque fois (nouvelle image, points, nombre
+et ecriture ppm avec framebuffer), pour des tailles d'image croissantes.
+Les images sont ecrites dans un dossier temporaire.
+utilisation : ./bench_draw.py [points_par_image]
+"""
+
+from sys import argv
+import os
+from tempfile import TemporaryDirectory
+from time import perf_counter
+
+import framebuffer
+
+
+TAILLES = [500, 1000, 2000, 4000, 8000]
+VIRGULE = 3
+
+
+def image_complete(pixels, nbr_de_points):
+    """Une image tracee et ecrite depuis zero, comme avant le moteur incremental"""
+    image = framebuffer.nouvelle_image(pixels)
+    compteur_pi = framebuffer.tirer_points(image, nbr_de_points)
+    valeur_pi_chaine = f"{4*(compteur_pi/nbr_de_points):.{VIRGULE+1}f}"
+    framebuffer.trace_nombre(image, valeur_pi_chaine[0]+valeur_pi_chaine[2:-1])
+    framebuffer.ecrire_ppm(f"img_{valeur_pi_chaine[0]}-{valeur_pi_chaine[2:-1]}.ppm", image)
+
+
+def main():
+    """Tableau des temps par image"""
+    nbr_de_points = int(argv[1]) if len(argv) > 1 else 10**5
+    dossier_initial = os.getcwd()
+    with TemporaryDirectory() as dossier:
+        os.chdir(dossier)
+        try:
+            print(f"{nbr_de_points} points par image")
+            for pixels in TAILLES:
+                debut = perf_counter()
+                image_complete(pixels, nbr_de_points)
+                duree_complete = perf_counter() - debut
+                moteur = framebuffer.MoteurImages(pixels, VIRGULE)
+                moteur.image_suivante(nbr_de_points)
+                debut = perf_counter()
+                moteur.image_suivante(nbr_de_points)
+                duree_moteur = perf_counter() - debut
+                print(f"{pixels:>5} pixels  moteur {duree_moteur:8.3f}s"
+                      f"  image complete {duree_complete:8.3f}s", flush=True)
+        finally:
+            os.chdir(dossier_initial)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+
+"""
+Nombre de points necessaires pour chaque mode d'echantillonnage de approximate_pi.
+Pour chaque mode et chaque N = 2^10 ... 2^taille_max on repete l'estimation
+avec des graines differentes et on mesure l'erreur quadratique moyenne,
+puis on donne le plus petit N (et son temps) qui atteint chaque precision.
+utilisation : ./bench_echantillonnage.py [log2_taille_max] [repetitions]
+"""
+
+from sys import argv
+from math import pi, sqrt
+from time import perf_counter
+import numpy as np
+
+from approximate_pi import MODES, approximation_mode
+
+
+PRECISIONS = [1e-2, 1e-3, 1e-4]
+
+
+def erreur(mode, nbr_de_points, repetitions):
+    """(erreur quadratique moyenne, temps moyen) sur repetitions estimations"""
+    graines = np.random.SeedSequence(0).spawn(repetitions)
+    carres, duree = 0, 0
+    for graine in graines:
+        debut = perf_counter()
+        estimation = approximation_mode(nbr_de_points, mode, np.random.default_rng(graine))
+        duree += perf_counter() - debut
+        carres += (estimation - pi)**2
+    return sqrt(carres/repetitions), duree/repetitions
+
+
+def main():
+    """Tableau des erreurs puis points necessaires par precision"""
+    log_max = int(argv[1]) if len(argv) > 1 else 22
+    repetitions = int(argv[2]) if len(argv) > 2 else 20
+    tailles = [2**k for k in range(10, log_max + 1)]
+    print(f"{'N':>9}", *(f"{mode:>13}" for mode in MODES))
+    mesures = {mode: [] for mode in MODES}
+    for taille in tailles:
+        for mode in MODES:
+            mesures[mode].append(erreur(mode, taille, repetitions))
+        print(f"{taille:>9}", *(f"{mesures[mode][-1][0]:13.2e}" for mode in MODES), flush=True)
+
+    print("\npoints (temps) pour une erreur quadratique moyenne inferieure a")
+    for precision in PRECISIONS:
+        print(f"{precision:>9.0e}", end="")
+        for mode in MODES:
+            atteint = [(taille, duree) for taille, (rmse, duree) in zip(tailles, mesures[mode])
+                       if rmse < precision]
+            if atteint:
+                taille, duree = atteint[0]
+                print(f" {taille:>8} ({1000*duree:6.1f}ms)", end="")
+            else:
+                print(f" {'> ' + str(tailles[-1]):>19}", end="")
+        print()
+
+
+if __name__ == "__main__":
+    main()
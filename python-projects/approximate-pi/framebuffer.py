@@ -0,0 +1,165 @@
+"""Images de draw.py dans un tableau numpy uint8 (pixels, pixels, 3)
+    Les points sont places par blocs (indexation vectorisee),
+    les chiffres sont des rectangles remplis par tranches
+    et une image s'ecrit en une seule ecriture du tampon"""
+
+#Librairies standards de Python
+from functools import lru_cache
+
+#Librairies externes
+import numpy as np
+
+#Module crée
+from approximate_pi import TAILLE_BLOC
+
+COULEUR_BACKGROUND = np.array([0xff, 0xff, 0xff], dtype=np.uint8)
+COULEUR_CERCLE = np.array([0x00, 0xff, 0x00], dtype=np.uint8)
+COULEUR_HORS_CERCLE = np.array([0xff, 0x00, 0x00], dtype=np.uint8)
+COULEUR = np.array([0x00, 0x00, 0x00], dtype=np.uint8)
+
+#Paramètre d'affichage
+ALPHA = 0.08 #Pourcentage que le segment va prendre de pixels//2
+SEP = 10 #Nombre de pixels qui SEParent les chiffres
+STROKE = 2 #Taille des segments de chiffres
+MAP_7_SEGMENT = {
+    0 : ["top", "topright", "topleft", "botright", "botleft", "bot"],
+    1: ["topright", "botright"],
+    2: ["top", "topright", "mid", "botleft", "bot"],
+    3: ["top", "topright", "mid", "botright", "bot"],
+    4: ["topright", "topleft", "mid", "botright"],
+    5: ["top", "topleft", "mid", "botright", "bot"],
+    6: ["top", "topleft", "mid", "botright", "botleft", "bot"],
+    7: ["top", "topright", "botright"],
+    8: ["top", "topright", "topleft", "mid", "botright", "botleft", "bot"],
+    9: ["top", "topright", "topleft", "mid", "botright", "bot"]
+}
+
+
+def nouvelle_image(pixels):
+    """Image carree remplie de la couleur de fond"""
+    image = np.empty((pixels, pixels, 3), dtype=np.uint8)
+    image[...] = COULEUR_BACKGROUND
+    return image
+
+def frac_to_pixels(fracs, pixels):
+    """frac_to_pixels de l'ancien draw.py sur un tableau : [-1, 1] -> pixels(1-y)//2
+    -1 donnerait pixels, on le ramene sur le dernier pixel"""
+    indices = (pixels*(1 - fracs)//2).astype(np.intp)
+    return np.minimum(indices, pixels - 1, out=indices)
+
+def placer_points(image, points):
+    """Colorie les points (tableau (n, 2) dans [-1, 1]) d'un coup,
+    retourne le nombre de points dans le cercle"""
+    pixels = image.shape[0]
+    cercle = np.einsum("ij,ij->i", points, points) <= 1
+    lignes = frac_to_pixels(points[:, 0], pixels)
+    colonnes = frac_to_pixels(points[:, 1], pixels)
+    #Comme dans l'ancien draw.py le dernier point tire sur un pixel donne sa couleur
+    image[lignes, colonnes] = np.where(cercle[:, None], COULEUR_CERCLE, COULEUR_HORS_CERCLE)
+    return int(np.count_nonzero(cercle))
+
+def tirer_points(image, nbr_de_points, generateur=None, taille_bloc=TAILLE_BLOC):
+    """Tire nbr_de_points dans le carre par blocs et les place dans l'image,
+    retourne le nombre de points dans le cercle"""
+    if generateur is None:
+        generateur = np.random.default_rng()
+    compteur = 0
+    for debut in range(0, nbr_de_points, taille_bloc):
+        taille = min(taille_bloc, nbr_de_points - debut)
+        compteur += placer_points(image, generateur.uniform(-1, 1, (taille, 2)))
+    return compteur
+
+@lru_cache(maxsize=1024)
+def rectangles_nombre(pixels, nombre):
+    """Rectangles (ligne1, ligne2, col1, col2), bornes hautes exclues, du nombre
+    en sept segments, avec la virgule apres le premier chiffre.
+    Memes positions que l'ancien trace_nombre de draw.py"""
+    chiffres = [int(chiffre) for chiffre in nombre]
+    seg = int((pixels/2)*ALPHA)
+    lignes = [int((pixels//2)*(1-ALPHA)), pixels//2, int((pixels//2)*(1+ALPHA))]
+    if len(chiffres) % 2:
+        col1 = pixels//2 - seg//2 - (len(chiffres)//2)*(SEP + seg)
+    else:
+        col1 = pixels//2 - SEP//2 - seg - (len(chiffres)//2 - 1)*(SEP + seg)
+    ords = [(col1 + k*(seg + SEP), col1 + k*(seg + SEP) + seg) for k in range(len(chiffres))]
+    epaisseur = max(STROKE, 1)
+    rectangles = []
+    if len(ords) > 1:
+        ligne, jpoint = lignes[2], (ords[1][0] + ords[0][1]) // 2
+        rectangles.append((ligne - max(3*STROKE, 1) + 1, ligne + 1,
+                           jpoint, jpoint + max(3*STROKE, 1)))
+    for chiffre, (col1, col2) in zip(chiffres, ords):
+        map_segments_rectangles = {
+            "top" : (lignes[0], lignes[0], col1, col2),
+            "topright"  : (lignes[0], lignes[1], col2, col2),
+            "topleft" : (lignes[0], lignes[1], col1, col1),
+            "mid" : (lignes[1], lignes[1], col1, col2),
+            "botright" : (lignes[1], lignes[2], col2, col2),
+            "bot" : (lignes[2], lignes[2], col1, col2),
+            "botleft" : (lignes[1], lignes[2], col1, col1),
+        }
+        for segment in MAP_7_SEGMENT[chiffre]:
+            ligne1, ligne2, col_1, col_2 = map_segments_rectangles[segment]
+            if ligne1 == ligne2:
+                rectangles.append((ligne1 - epaisseur + 1, ligne1 + epaisseur, col_1, col_2 + 1))
+            else:
+                rectangles.append((ligne1, ligne2 + 1, col_1 - epaisseur + 1, col_1 + epaisseur))
+    return tuple(rectangles)
+
+@lru_cache(maxsize=64)
+def zone_nombre(pixels, nbr_chiffres):
+    """Tranches (lignes, colonnes) couvrant tout nombre de nbr_chiffres chiffres"""
+    rectangles = rectangles_nombre(pixels, "8"*nbr_chiffres)
+    return (slice(max(0, min(r[0] for r in rectangles)), max(r[1] for r in rectangles)),
+            slice(max(0, min(r[2] for r in rectangles)), max(r[3] for r in rectangles)))
+
+def trace_nombre(image, nombre, couleur=COULEUR):
+    """Tracer un nombre sur l'image"""
+    for ligne1, ligne2, col1, col2 in rectangles_nombre(image.shape[0], nombre):
+        image[ligne1:ligne2, col1:col2] = couleur
+    return image
+
+class MoteurImages:
+    """
+    Images successives de l'animation de pi, tracees dans un seul tampon.
+
+    moteur = MoteurImages(400, 3)
+    for _ in range(10):
+        image = moteur.image_suivante(10000)
+
+    Les compteurs sont cumules d'une image a l'autre : l'estimation affichee
+    porte sur tous les points tires depuis le debut.
+    Le nombre est trace directement dans le tampon, apres avoir sauve
+    la petite zone qu'il recouvre, restauree avant l'image suivante :
+    une image coute le placement des nouveaux points plus la zone du nombre,
+    quelle que soit la taille de l'image.
+    """
+    def __init__(self, pixels, virgule, generateur=None):
+        self.image = nouvelle_image(pixels)
+        self.virgule = virgule
+        self.generateur = np.random.default_rng() if generateur is None else generateur
+        self.compteur_pi, self.compteur_genere = 0, 0
+        self.zone = zone_nombre(pixels, virgule + 1)
+        self.sous_nombre = None #Pixels caches par le nombre trace
+
+    def estimation(self):
+        """Estimation de pi sur tous les points tires"""
+        return 4*(self.compteur_pi/self.compteur_genere)
+
+    def image_suivante(self, nbr_de_points):
+        """Tire nbr_de_points de plus et retourne l'image avec l'estimation courante.
+        Le tableau retourne est le tampon lui-meme : il change a l'appel suivant"""
+        if self.sous_nombre is not None:
+            self.image[self.zone] = self.sous_nombre
+        self.compteur_pi += tirer_points(self.image, nbr_de_points, self.generateur)
+        self.compteur_genere += nbr_de_points
+        self.sous_nombre = self.image[self.zone].copy()
+        valeur_pi_chaine = f"{self.estimation():.{self.virgule+1}f}"
+        trace_nombre(self.image, valeur_pi_chaine[0]+valeur_pi_chaine[2:-1])
+        return self.image
+
+def ecrire_ppm(filename, image):
+    """Ecrit l'image au format ppm binaire, les pixels en une seule ecriture"""
+    with open(filename, "wb") as file:
+        file.write(f"P6 {image.shape[1]} {image.shape[0]} 255\n".encode("UTF-8"))
+        file.write(np.ascontiguousarray(image).data)
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""========================================================================
+Box subdivision (BezierIntersectionIterative) against Bezier clipping
+(BezierClipping) : number of iterations, roots and time
+
+Configurations, each written with curves of several degrees
+(degree elevation does not change the curves) :
+    transversal : two random curves of the unit square (average of 20 pairs)
+    oscillating : y = sin(k pi x) fitted by a curve, against y = 0
+    near tangent : the parabola y = x^2 against the line y = 1e-6
+    tangent : the parabola y = x^2 against the line y = 0
+
+    ./bench_clipping.py [eps]
+========================================================================"""
+
+from sys import argv
+from math import comb
+from time import perf_counter
+
+import numpy as np
+
+from bernstein import BernsteinBasis
+from intersection import Methods, RootStore
+
+DEGREES = [3, 5, 10, 20]
+
+
+def Elevate(P, degree):
+    """ Control polygon (2, degree+1) of the same curve as P """
+    n = P.shape[1] - 1
+    E = np.zeros((n + 1, degree + 1))
+    for i in range(n + 1):
+        for j in range(i, i + degree - n + 1):
+            E[i, j] = comb(n, i) * comb(degree - n, j - i) / comb(degree, j)
+    return P @ E
+
+
+def Transversal(degree, rng):
+    """ Random curves of the unit square """
+    return [(rng.uniform(0, 1, (2, degree + 1)), rng.uniform(0, 1, (2, degree + 1)))
+            for _ in range(20)]
+
+
+def Oscillating(degree, rng):
+    """ Fit of y = sin(k pi x), k = degree/4, against the segment y = 0 """
+    t = np.linspace(0, 1, 4 * (degree + 1))
+    yp = np.linalg.lstsq(BernsteinBasis(degree, t).T,
+                         np.sin(max(1, degree // 4) * np.pi * t + 0.1), rcond=None)[0]
+    xp = np.linspace(0, 1, degree + 1)
+    return [(np.array([xp, yp]), np.array([xp, np.zeros(degree + 1)]))]
+
+
+def Parabola(height):
+    """ y = x^2 on [-1,1] against the line y = height """
+    def Curves(degree, rng):
+        parabola = np.array([[-1., 0., 1.], [1., -1., 1.]])
+        line = np.array([[-1., 1.], [height, height]])
+        return [(Elevate(parabola, degree), Elevate(line, degree))]
+    return Curves
+
+
+CONFIGURATIONS = {
+    "transversal": Transversal,
+    "oscillating": Oscillating,
+    "near tangent": Parabola(1e-6),
+    "tangent": Parabola(0.),
+}
+
+
+def Run(method, pairs, eps):
+    """ (iterations, roots, seconds) summed over the pairs """
+    iterations, roots = 0, 0
+    start = perf_counter()
+    for P1, P2 in pairs:
+        found = RootStore(1e-4)
+        iterations += Methods[method](P1[0], P1[1], P2[0], P2[1], eps, found)
+        roots += len(found)
+    return iterations, roots, perf_counter() - start
+
+
+if __name__ == '__main__':
+    eps = float(argv[1]) if len(argv) > 1 else 1e-6
+    print(f"eps = {eps:g}")
+    print(f"{'':>13} {'degree':>6} | {'subdivision':>31} | {'clipping':>31}")
+    for name, Curves in CONFIGURATIONS.items():
+        for degree in DEGREES:
+            pairs = Curves(degree, np.random.default_rng(degree))
+            line = f"{name:>13} {degree:>6}"
+            for method in ("iterative", "clipping"):
+                iterations, roots, duration = Run(method, pairs, eps)
+                line += f" | {iterations:>7} it {roots:>4} roots {1000 * duration:8.1f}ms"
+            print(line, flush=True)
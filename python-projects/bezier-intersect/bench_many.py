@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""========================================================================
+Throughput of IntersectAllCurves on CAD-like data
+
+Random chains of cubic Bezier segments (consecutive segments share
+an end point) in a square ; for each number of processes we print
+the number of candidate pairs kept by the sweep, the number of
+intersections and the throughput in candidate pairs per second ;
+IntersectAllCurves uses at most one process per core, so the rows
+above the number of cores repeat the last one
+
+    ./bench_many.py [number_of_segments] [max_processes]
+========================================================================"""
+
+from sys import argv
+from os import cpu_count
+from time import perf_counter
+
+import numpy as np
+
+from intersect_all import CurveBoxes, CandidatePairs, IntersectAllCurves
+
+
+def RandomChains(nb_segments, rng, segments_per_chain=20, side=100.):
+    """ Chains of cubic segments, each segment of length about 1
+      """
+    curves = []
+    while len(curves) < nb_segments:
+        point = rng.uniform(0, side, 2)
+        for _ in range(min(segments_per_chain, nb_segments - len(curves))):
+            end = point + rng.normal(0, 1, 2)
+            inner = point + (end - point) * [[1 / 3], [2 / 3]] + rng.normal(0, 0.3, (2, 2))
+            control = np.vstack((point, inner, end))
+            curves.append((control[:, 0], control[:, 1]))
+            point = end
+    return curves
+
+
+if __name__ == '__main__':
+    nb_segments = int(argv[1]) if len(argv) > 1 else 5000
+    max_processes = int(argv[2]) if len(argv) > 2 else cpu_count()
+    curves = RandomChains(nb_segments, np.random.default_rng(0))
+
+    start = perf_counter()
+    first, second = CandidatePairs(CurveBoxes(curves))
+    sweep = perf_counter() - start
+    all_pairs = nb_segments * (nb_segments - 1) // 2
+    print(f"{cpu_count()} cores, {nb_segments} segments, {all_pairs} pairs, {len(first)} candidates "
+          f"after the sweep ({sweep:.3f}s)")
+
+    processes = 1
+    while processes <= max_processes:
+        start = perf_counter()
+        roots = IntersectAllCurves(curves, processes=processes)
+        duration = perf_counter() - start
+        print(f"{processes:>3} processes : {len(roots[0])} intersections, {duration:7.2f}s, "
+              f"{len(first) / duration:9.0f} pairs/s")
+        processes *= 2
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""========================================================================
+Duplicate test of the roots : scan of all the roots against RootStore,
+and quality of the clusters merged by RootStore.Merge
+
+Part 1 : N roots on a grid of [0,1]x[0,1], each one found 3 times
+         (with a shift smaller than err), are added in a random order ;
+         we print the time of the scan and of the store
+Part 2 : the oscillating curves of bench_subdivision.py are intersected
+         with a tiny err, so that the same intersection is kept several
+         times ; the roots are then merged (radius 1e-4) and we print the
+         number of roots, the cluster sizes and spreads, and the
+         residuals |P1(u) - P2(v)| before and after the Newton polish
+
+    ./bench_roots.py [max_roots]
+========================================================================"""
+
+from sys import argv
+from time import perf_counter
+
+import numpy as np
+
+from bernstein import BezierValues
+from bench_subdivision import Oscillating
+from intersection import Methods, RootStore
+
+MaxScan = 10000  # the scan is quadratic : not timed above this number of roots
+
+
+def Candidates(nb_roots, err, rng):
+    """ (u, v) of nb_roots roots, each one 3 times, in a random order """
+    side = int(np.ceil(np.sqrt(nb_roots)))
+    grid = (np.arange(nb_roots)[:, None] // [side, 1] % side + 0.5) / side
+    candidates = np.repeat(grid, 3, axis=0) + rng.uniform(-err / 3, err / 3, (3 * nb_roots, 2))
+    return candidates[rng.permutation(len(candidates))].tolist()
+
+
+def Scan(candidates, err):
+    """ Duplicate test of AddRoot before RootStore """
+    roots = []
+    for u, v in candidates:
+        for root in roots:
+            if abs(u - root[0]) < err and abs(v - root[1]) < err:
+                break
+        else:
+            roots.append((u, v, 0., 0.))
+    return roots
+
+
+def Store(candidates, err):
+    """ Same test with a RootStore """
+    roots = RootStore(err)
+    for u, v in candidates:
+        if roots.Find(u, v) is None:
+            roots.Insert(u, v, 0., 0.)
+    return roots
+
+
+def Residuals(curves, roots):
+    """ |P1(u) - P2(v)| of the roots """
+    xp1, yp1, xp2, yp2 = curves
+    u, v = np.array(roots).reshape(-1, 4)[:, :2].T
+    return np.hypot(*(BezierValues([xp1, yp1], u) - BezierValues([xp2, yp2], v)))
+
+
+if __name__ == '__main__':
+    max_roots = int(argv[1]) if len(argv) > 1 else 20000
+    err = 1e-4
+    print(f"{'roots':>8} {'candidates':>10} | {'scan':>9} | {'store':>9}")
+    nb_roots = 100
+    while nb_roots <= max_roots:
+        candidates = Candidates(nb_roots, err, np.random.default_rng(nb_roots))
+        start = perf_counter()
+        kept = len(Store(candidates, err))
+        store = perf_counter() - start
+        scan = "-"
+        if nb_roots <= MaxScan:
+            start = perf_counter()
+            assert len(Scan(candidates, err)) == kept
+            scan = f"{perf_counter() - start:8.3f}s"
+        print(f"{kept:>8} {len(candidates):>10} | {scan:>9} | {store:8.3f}s")
+        nb_roots *= 4
+
+    print()
+    print(f"{'degree':>6} {'method':>9} | {'raw':>4} {'merged':>6} {'reference':>9} | "
+          f"{'max size':>8} {'max spread':>10} | {'residual before':>15} {'after':>9}")
+    for degree in (10, 20, 40):
+        curves = Oscillating(degree)
+        reference = RootStore(err)
+        Methods["iterative"](*curves, 0.002, reference)
+        for method in ("iterative", "clipping"):
+            roots = RootStore(1e-12)
+            Methods[method](*curves, 1e-6, roots)
+            before = Residuals(curves, roots).max()
+            raw = len(roots)
+            sizes, spreads, residuals = roots.Merge(*curves, radius=err)
+            print(f"{degree:>6} {method:>9} | {raw:>4} {len(roots):>6} {len(reference):>9} | "
+                  f"{sizes.max():>8} {spreads.max():10.2e} | {before:15.2e} {residuals.max():9.2e}")
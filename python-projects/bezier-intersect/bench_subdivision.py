@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""========================================================================
+Recursive (BezierIntersection) against iterative
+(BezierIntersectionIterative) subdivision on high-degree curves
+
+Curve 1 : least-squares fit of y = sin(k pi x) on [0,1] with a Bezier
+          curve of the given degree (k = degree/4 oscillations)
+Curve 2 : the segment y = 0 written as a Bezier curve of the same degree
+For each degree we print the number of roots, the time and the peak of
+memory allocated (tracemalloc). In the last case the curves meet at
+their first control point, which needs a depth larger than the
+recursion limit of Python
+
+    ./bench_subdivision.py [max_degree]
+========================================================================"""
+
+from sys import argv, getrecursionlimit
+from time import perf_counter
+import tracemalloc
+
+import numpy as np
+
+from bernstein import BernsteinBasis
+from intersection import IntersectBezierCurves
+
+
+def Oscillating(degree, phase=0.1):
+    """ Control polygons of the two curves (x is t on both curves) """
+    t = np.linspace(0, 1, 4 * (degree + 1))
+    B = BernsteinBasis(degree, t)
+    yp = np.linalg.lstsq(B.T, np.sin(max(1, degree // 4) * np.pi * t + phase), rcond=None)[0]
+    yp[0] = np.sin(phase)  # exact first point
+    xp = np.linspace(0, 1, degree + 1)
+    return xp, yp, xp, np.zeros(degree + 1)
+
+
+def Measure(method, curves, eps):
+    """ (roots, seconds, peak bytes) ; the peak is measured in a second run
+          since tracemalloc slows down Python code
+      """
+    start = perf_counter()
+    try:
+        roots = IntersectBezierCurves(*curves, eps=eps, method=method)
+    except RecursionError:
+        return None, perf_counter() - start, 0
+    duration = perf_counter() - start
+    tracemalloc.start()
+    IntersectBezierCurves(*curves, eps=eps, method=method)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return roots, duration, peak
+
+
+if __name__ == '__main__':
+    max_degree = int(argv[1]) if len(argv) > 1 else 40
+    degree = 5
+    cases = []
+    while degree <= max_degree:
+        cases.append((degree, 0.002, 0.1))
+        degree *= 2
+    # root at u = v = 0 : the intervals [0, 2^-k] go deeper than the recursion limit
+    cases.append((10, 2.**-getrecursionlimit(), 0.))
+    for degree, eps, phase in cases:
+        curves = Oscillating(degree, phase)
+        print(f"degree {degree:>3}, eps {eps:.0e}")
+        for method in ("recursive", "iterative"):
+            roots, duration, peak = Measure(method, curves, eps)
+            if roots is None:
+                print(f"  {method:>10} : RecursionError after {duration:.2f}s")
+            else:
+                print(f"  {method:>10} : {len(roots[0]):>3} roots {duration:8.3f}s "
+                      f"peak {peak / 1024:8.1f} KiB")
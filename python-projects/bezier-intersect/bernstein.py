@@ -0,0 +1,81 @@
+"""========================================================================
+Bernstein basis engine for the Bezier curves of BezierIntersect.py
+
+The binomial coefficients of each degree are computed once and cached.
+For an array of T parameters, the basis functions and their derivatives
+are returned as (degree+1, T) matrices, so that a curve is evaluated
+with one matrix product :
+    x(t) = xControlPt @ B        x'(t) = xControlPt @ dB
+========================================================================"""
+
+from functools import lru_cache
+from math import comb
+
+import numpy as np
+
+
+@lru_cache(maxsize=None)
+def BinomialRow(n):
+    """ Row n of Pascal's triangle : binom(n, k) for k = 0..n
+          (read-only array, shared by all callers)
+      """
+    row = np.array([comb(n, k) for k in range(n + 1)], dtype=float)
+    row.flags.writeable = False
+    return row
+
+
+def BernsteinBasis(n, t):
+    """ Bernstein polynomials of degree n at the parameters t
+          Return B with B[k, i] = binom(n, k) t_i^k (1 - t_i)^(n - k)
+          shape (n+1, T) (T = 1 if t is a scalar)
+      """
+    t = np.atleast_1d(np.asarray(t, dtype=float))
+    k = np.arange(n + 1)[:, None]
+    return BinomialRow(n)[:, None] * t**k * (1 - t)**(n - k)
+
+
+def BernsteinDerivativeBasis(n, t):
+    """ Derivatives of the Bernstein polynomials of degree n at the parameters t
+          B'_{n,k} = n (B_{n-1,k-1} - B_{n-1,k}),  shape (n+1, T)
+      """
+    t = np.atleast_1d(np.asarray(t, dtype=float))
+    dB = np.zeros((n + 1, len(t)))
+    if n > 0:
+        lower = n * BernsteinBasis(n - 1, t)
+        dB[1:] += lower
+        dB[:-1] -= lower
+    return dB
+
+
+def BernsteinValuesAndDerivatives(n, t):
+    """ Basis B and derivative basis dB of degree n at the parameters t,
+          both of shape (n+1, T)
+      """
+    return BernsteinBasis(n, t), BernsteinDerivativeBasis(n, t)
+
+
+@lru_cache(maxsize=64)
+def SampledBasis(n, nbti):
+    """ Basis of degree n at nbti regularly spaced parameters of [0,1]
+          (cached : used for every plot of a curve of degree n)
+      """
+    B = BernsteinBasis(n, np.linspace(0, 1, nbti))
+    B.flags.writeable = False
+    return B
+
+
+def BezierValues(ControlPt, t):
+    """ Values of the Bezier function at the parameters t
+          ControlPt : control points, shape (n+1,) or (dim, n+1)
+          Return an array of shape (T,) or (dim, T)
+      """
+    ControlPt = np.asarray(ControlPt, dtype=float)
+    return ControlPt @ BernsteinBasis(ControlPt.shape[-1] - 1, t)
+
+
+def BezierDerivatives(ControlPt, t):
+    """ Derivatives of the Bezier function at the parameters t
+          same shapes as BezierValues
+      """
+    ControlPt = np.asarray(ControlPt, dtype=float)
+    return ControlPt @ BernsteinDerivativeBasis(ControlPt.shape[-1] - 1, t)
@@ -0,0 +1,95 @@
+"""========================================================================
+All-pairs intersection of many plane Bezier curves
+
+Step 1 (broad phase) :
+    the min-max box of the control points of each curve is computed
+    (MinMaxBoxCP) and the boxes are swept along x (sweep and prune) :
+    only the pairs of curves whose boxes overlap are kept
+
+Step 2 (narrow phase) :
+    each candidate pair goes through IntersectBezierCurves
+    (subdivision + Newton), the pairs being shared between processes
+
+    i, j, u, v, x, y = IntersectAllCurves(curves)
+
+gives one entry per intersection : curves[i] at u meets curves[j] at v
+(i < j) at the point (x, y). Self-intersections are not searched.
+========================================================================"""
+
+from multiprocessing import Pool
+from os import cpu_count
+
+import numpy as np
+
+from intersection import MinMaxBoxCP, IntersectBezierCurves
+
+# Below this number of candidate pairs a process pool costs more than it saves :
+# starting a pool takes about 20 ms and a pair of cubics about 0.8 ms, so two
+# processes break even near 50 pairs ; 200 leaves room for the transfers
+MinPairsForPool = 200
+
+
+def CurveBoxes(curves):
+    """ Boxes of the curves (list of (xp, yp)) as an (N, 4) array
+          with columns xmin, xmax, ymin, ymax
+      """
+    boxes = np.empty((len(curves), 4))
+    for k, (xp, yp) in enumerate(curves):
+        Bx, By = MinMaxBoxCP(xp, yp)
+        boxes[k] = Bx[0], Bx[1], By[0], By[1]
+    return boxes
+
+
+def CandidatePairs(boxes):
+    """ Sweep and prune : pairs (i, j), i < j, of overlapping boxes
+          The boxes are sorted by xmin ; the boxes overlapping box i along x
+          are the following ones with xmin <= xmax of box i (binary search),
+          and among them we keep those overlapping along y
+          Return two arrays i, j
+      """
+    order = np.argsort(boxes[:, 0], kind="stable")
+    xmin = boxes[order, 0]
+    ends = np.searchsorted(xmin, boxes[order, 1], side="right")
+    counts = np.maximum(ends - np.arange(len(order)) - 1, 0)
+    first = np.repeat(np.arange(len(order)), counts)
+    # rank of each candidate inside the group of its first box
+    offsets = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+    second = first + 1 + offsets
+    i, j = order[first], order[second]
+    keep = (boxes[i, 2] <= boxes[j, 3]) & (boxes[j, 2] <= boxes[i, 3])
+    i, j = i[keep], j[keep]
+    return np.minimum(i, j), np.maximum(i, j)
+
+
+def _IntersectPair(job):
+    """ Worker : job = (i, j, curve i, curve j, eps)
+          Return the list of the (i, j, u, v, x, y)
+      """
+    i, j, (xp1, yp1), (xp2, yp2), eps = job
+    u, v, x, y = IntersectBezierCurves(xp1, yp1, xp2, yp2, eps)
+    return [(i, j, *root) for root in zip(u, v, x, y)]
+
+
+def IntersectAllCurves(curves, eps=0.002, processes=None, chunksize=None):
+    """ Intersections of all the pairs of curves (list of (xp, yp))
+          processes : number of processes (None : one per core, 1 : no pool),
+                      never more than the number of cores
+          chunksize : pairs sent at once to a process (None : about four
+                      chunks per process, as Pool.map does)
+          Return the arrays i, j, u, v, x, y sorted by (i, j, u)
+      """
+    curves = [(np.asarray(xp, dtype=float), np.asarray(yp, dtype=float)) for xp, yp in curves]
+    first, second = CandidatePairs(CurveBoxes(curves))
+    jobs = ((i, j, curves[i], curves[j], eps) for i, j in zip(first.tolist(), second.tolist()))
+    processes = min(processes or cpu_count(), cpu_count())
+    if processes == 1 or len(first) < MinPairsForPool:
+        results = map(_IntersectPair, jobs)
+        roots = [root for result in results for root in result]
+    else:
+        chunksize = chunksize or -(-len(first) // (4 * processes))
+        with Pool(processes) as pool:
+            roots = [root for result in pool.imap_unordered(_IntersectPair, jobs, chunksize)
+                     for root in result]
+    roots.sort()
+    i, j, u, v, x, y = np.array(roots, dtype=float).reshape(-1, 6).T
+    return i.astype(int), j.astype(int), u, v, x, y
@@ -0,0 +1,644 @@
+"""========================================================================
+Intersection of two plane Bezier curves, without any drawing
+
+Same method as BezierIntersect.py (exclusion + subdivision, then
+Newton-Raphson in the parameter domain), but the roots are returned
+as arrays instead of being stored in global lists and plotted :
+
+    u, v, x, y = IntersectBezierCurves(xp1, yp1, xp2, yp2)
+
+u, v are the parameters of the intersections on each curve (in [0,1])
+and (x, y) the intersection points. This module only needs numpy,
+so it can be used from scripts or services without matplotlib.
+
+The keyword method chooses the search (keys of Methods) :
+    "recursive" : subdivision as in BezierIntersect.py
+    "iterative" : same subdivision with an explicit stack (default)
+    "clipping"  : Bezier clipping with fat lines (fewer iterations)
+========================================================================"""
+
+from functools import lru_cache
+from math import ceil, comb, floor, log2
+
+import numpy as np
+
+from bernstein import BernsteinValuesAndDerivatives, BezierDerivatives, BezierValues
+
+#######################
+#  BEZIER FUNCTIONS
+#######################
+
+
+def OneSubdivBezierCurve(xpt, ypt):
+    """ One subdivision of the input control polygon according parameter 1/2
+          Return the two subdivided control polygons 
+              xpt1, ypt1
+              xpt2, ypt2
+      """
+    n = len(xpt) - 1  # degree of the Bézier curve
+    xp = np.zeros(2 * n + 1)
+    yp = np.zeros(2 * n + 1)
+    # Initialization
+    for i in range(n + 1):
+        xp[2 * i] = xpt[i]
+        yp[2 * i] = ypt[i]
+    # Main loop
+    for j in range(1, n + 1):
+        for i in range(n + 1 - j):
+            k = j + 2 * i
+            xp[k] = (xp[k - 1] + xp[k + 1]) / 2.
+            yp[k] = (yp[k - 1] + yp[k + 1]) / 2.
+    # We split the subivided polygon in two control polygons
+    xpt1 = xp[0:n + 1]
+    xpt2 = xp[n:2 * n + 1]
+    ypt1 = yp[0:n + 1]
+    ypt2 = yp[n:2 * n + 1]
+    return xpt1, ypt1, xpt2, ypt2
+
+
+#######################
+# BOXES FUNCTIONS
+#######################
+
+
+def MinMaxBoxCP(xControlPt, yControlPt):
+    """ Determination of the rectangular min-max box that contains 
+          all control points
+          Return the tuple Box = (Bx, By) with :
+              Bx = np.array([xmin, xmax])
+              By = np.array([ymin, ymax])
+      """
+    Bx = np.array([min(xControlPt), max(xControlPt)])
+    By = np.array([min(yControlPt), max(yControlPt)])
+    Box = (Bx, By)  # bas a gauche et haut a droite
+    return Box
+
+
+def IntersectBox1D(I1, I2):
+    """ Intersection of the 1-dimensional boxes I1 and I2
+          precisely, here I1 and I2 are intervals : 
+              I1 = [a1,b1] with a1 <= b1 , I1 is an np.array
+              I2 = [a2,b2] with a2 <= b2 , I2 is an np.array
+          return  inter = 1 if the two intervals intersect, = 0 if not
+                  K = the intersection interval (np.array)
+                    = np.array([]) if inter = 0
+      """
+    if (I1[1] < I2[0]) or (I1[0] > I2[1]):
+        K = np.array([])
+        inter = 0
+    else:
+        K = I1.copy()  # the box of the caller must not be clipped
+        inter = 1
+        if I1[0] < I2[0]:
+            K[0] = I2[0]
+        if I1[1] > I2[1]:
+            K[1] = I2[1]
+    return inter, K
+
+
+def IntersectBox2D(Box1, Box2):
+    """ Intersection of the 2-dimensional boxes Box1 and Box2
+          A box is a tuple Box = (Bx, By) with :
+              Bx = np.array([xmin, xmax])
+              By = np.array([ymin, ymax])
+          Return  1 if the boxes intersect, 0 if they do not intersect
+                  the intersection box in case Box1 and Box2 intersect
+      """
+    box = ()
+    interx, Kx = IntersectBox1D(Box1[0], Box2[0])
+    intery, Ky = IntersectBox1D(Box1[1], Box2[1])
+    inter = interx * intery
+    if inter == 1:
+        box = (Kx, Ky)
+    return inter, box
+
+##########################
+# ROOT STORE
+##########################
+
+
+class RootStore(list):
+    """
+    List of the roots (u, v, x, y) found on a pair of curves, with their
+    parameters hashed on a grid of step err : a root closer than err
+    (in u and v) to a known root can only be in the 3x3 cells around its
+    own cell, so the duplicate test takes constant time instead of a scan
+    of all the roots.
+
+    roots = RootStore(1e-4)
+    if roots.Find(u, v) is None:
+        roots.Insert(u, v, x, y)
+
+    The roots kept are the same as with the scan : the first root found
+    in a group of close roots.
+    """
+    def __init__(self, err=1e-4, roots=()):
+        super().__init__()
+        self.err = err
+        self.cells = {}
+        for root in roots:
+            self.Insert(*root)
+
+    def Cell(self, u, v):
+        """ Grid cell of the parameters (u, v) """
+        return floor(u / self.err), floor(v / self.err)
+
+    def Find(self, u, v):
+        """ Index of a root closer than err to (u, v), None if there is none """
+        i, j = self.Cell(u, v)
+        for di in (-1, 0, 1):
+            for dj in (-1, 0, 1):
+                for k in self.cells.get((i + di, j + dj), ()):
+                    if abs(u - self[k][0]) < self.err and abs(v - self[k][1]) < self.err:
+                        return k
+        return None
+
+    def Insert(self, u, v, x, y):
+        """ Append the root without any duplicate test """
+        self.cells.setdefault(self.Cell(u, v), []).append(len(self))
+        self.append((u, v, x, y))
+
+    def Clusters(self, radius):
+        """ Groups of roots linked by distances (in u and v) smaller than radius
+              (grid of step radius and union-find)
+              Return a list of lists of indices
+          """
+        parent = list(range(len(self)))
+
+        def Root(k):
+            while parent[k] != k:
+                parent[k] = parent[parent[k]]
+                k = parent[k]
+            return k
+
+        grid = {}
+        for k, (u, v, _, _) in enumerate(self):
+            i, j = floor(u / radius), floor(v / radius)
+            for di in (-1, 0, 1):
+                for dj in (-1, 0, 1):
+                    for other in grid.get((i + di, j + dj), ()):
+                        if abs(u - self[other][0]) < radius and abs(v - self[other][1]) < radius:
+                            parent[Root(other)] = Root(k)
+            grid.setdefault((i, j), []).append(k)
+        clusters = {}
+        for k in range(len(self)):
+            clusters.setdefault(Root(k), []).append(k)
+        return list(clusters.values())
+
+    def Rebuild(self, roots):
+        """ Replace the roots (and their grid) by the given ones """
+        self.clear()
+        self.cells = {}
+        for root in roots:
+            self.Insert(*root)
+
+    def Sort(self, leaves=None):
+        """ Sort the roots (by u, then v) ; leaves, the list of the polygons
+              of each root given by AddRoot, is reordered alike
+          """
+        order = sorted(range(len(self)), key=self.__getitem__)
+        self.Rebuild([self[k] for k in order])
+        if leaves is not None:
+            leaves[:] = [leaves[k] for k in order]
+
+    def Merge(self, xp1, yp1, xp2, yp2, radius, NbSteps=7, leaves=None):
+        """ Replace each cluster of roots (see Clusters) by one root :
+              Newton method on the whole curves from the mean of the cluster,
+              or the root of the cluster of smallest residual if Newton leaves
+              [0,1]x[0,1] or does not improve it
+              leaves (one entry per root, see AddRoot) keeps for each cluster
+              the polygons of its root of smallest residual
+              Return the clusters quality : arrays of the cluster sizes,
+              their spreads (largest distance in u or v to the mean) and the
+              residuals |P1(u) - P2(v)| of the merged roots
+          """
+        P1 = np.array([xp1, yp1], dtype=float)
+        P2 = np.array([xp2, yp2], dtype=float)
+        merged, merged_leaves, sizes, spreads, residuals = [], [], [], [], []
+        for cluster in self.Clusters(radius):
+            members = np.array([self[k][:2] for k in cluster])
+            mean = members.mean(axis=0)
+            candidates = members.tolist()
+            u, v = Newton2Var(xp1, yp1, [mean[0]] * 2, xp2, yp2, [mean[1]] * 2, NbSteps)
+            if 0 <= u <= 1 and 0 <= v <= 1:
+                candidates.append((u, v))
+            candidates = np.array(candidates)
+            gaps = BezierValues(P1, candidates[:, 0]) - BezierValues(P2, candidates[:, 1])
+            gaps = np.hypot(*gaps)
+            best = np.argmin(gaps)
+            u, v = candidates[best]
+            x, y = BezierValues(P1, u)[:, 0]
+            merged.append((u, v, x, y))
+            sizes.append(len(cluster))
+            spreads.append(np.abs(members - mean).max())
+            residuals.append(gaps[best])
+            if leaves is not None:
+                merged_leaves.append(leaves[cluster[np.argmin(gaps[:len(cluster)])]])
+        self.Rebuild(merged)
+        if leaves is not None:
+            leaves[:] = merged_leaves
+        return np.array(sizes), np.array(spreads), np.array(residuals)
+
+
+##########################
+# THE RECURSIVE FUNCTION
+##########################
+
+
+# A root is kept if the curves are closer than ResidualTolerance times
+# the size of the coordinates (max(1, largest absolute coordinate))
+ResidualTolerance = 1e-6
+
+
+def AddRoot(xp1, yp1, I1, xp2, yp2, I2, roots, NbSteps=7, leaves=None):
+    """ Newton method on the subdivided curves (xp1, yp1) and (xp2, yp2)
+          of intervals I1 and I2, then the root (u, v, x, y) of the whole
+          curves is inserted in the RootStore roots, unless it is outside
+          [0,1]x[0,1], the curves do not meet there (ResidualTolerance)
+          or it is closer than roots.err to a known root
+      """
+    X0 = Newton2Var(xp1, yp1, [0, 1], xp2, yp2, [0, 1], NbSteps)
+    u = I1[0] + X0[0] * (I1[1] - I1[0])
+    v = I2[0] + X0[1] * (I2[1] - I2[0])
+    if not (0 <= u <= 1 and 0 <= v <= 1):
+        return
+    P1 = np.array([xp1, yp1], dtype=float)
+    P2 = np.array([xp2, yp2], dtype=float)
+    x, y = BezierValues(P1, X0[0])[:, 0]
+    residual = np.hypot(*(BezierValues(P2, X0[1])[:, 0] - (x, y)))
+    if not residual <= ResidualTolerance * max(1., np.abs(P1).max(), np.abs(P2).max()):
+        return
+    ## Not allowing duplicates
+    if roots.Find(u, v) is not None:
+        return
+    roots.Insert(u, v, x, y)
+    if leaves is not None:
+        leaves.append((np.array(xp1), np.array(yp1), np.array(xp2), np.array(yp2)))
+
+
+
+def BezierIntersection(xp1, yp1, I1, xp2, yp2, I2, eps, roots,
+                       NbSteps=7, leaves=None):
+    """ Recursive intersection of 2 Bezier curves
+          xp1,yp1,xp2,yp2 : control points of the subdivided curves
+          I1, I2 : associated interval for each curve (included in [0,1])
+          roots : RootStore of the (u, v, x, y) already found, completed in place
+
+          When the intervals are smaller than eps, Newton method is applied
+          to the subdivided curves (parameters s, t in [0,1]) and the root
+          is brought back to the whole curves : u = I1[0] + s*(I1[1]-I1[0])
+          A root closer than roots.err (in u and v) to a known root is ignored.
+          If leaves is a list, the control polygons of the subdivided curves
+          giving a new root are appended to it (used for display).
+          Return the number of pairs of subdivided curves examined
+      """
+    if (I1[1] - I1[0]) <= eps:
+        AddRoot(xp1, yp1, I1, xp2, yp2, I2, roots, NbSteps, leaves)
+        return 1
+
+    # subdivision of each Bezier curve
+    I1_left, I1_right = [I1[0], (I1[0] + I1[1]) / 2], [(I1[0] + I1[1]) / 2, I1[1]]
+    I2_left, I2_right = [I2[0], (I2[0] + I2[1]) / 2], [(I2[0] + I2[1]) / 2, I2[1]]
+    xp11, yp11, xp12, yp12 = OneSubdivBezierCurve(xp1, yp1)
+    xp21, yp21, xp22, yp22 = OneSubdivBezierCurve(xp2, yp2)
+    # bounding box of each subdivided control polygon
+    box11 = MinMaxBoxCP(xp11, yp11)
+    box12 = MinMaxBoxCP(xp12, yp12)
+    box21 = MinMaxBoxCP(xp21, yp21)
+    box22 = MinMaxBoxCP(xp22, yp22)
+    # tests and recursivity ...
+    count = 1
+    for box_a, xa, ya, Ia, box_b, xb, yb, Ib in (
+            (box11, xp11, yp11, I1_left, box21, xp21, yp21, I2_left),
+            (box12, xp12, yp12, I1_right, box21, xp21, yp21, I2_left),
+            (box11, xp11, yp11, I1_left, box22, xp22, yp22, I2_right),
+            (box12, xp12, yp12, I1_right, box22, xp22, yp22, I2_right)):
+        if IntersectBox2D(box_a, box_b)[0]:
+            count += BezierIntersection(xa, ya, Ia, xb, yb, Ib, eps, roots, NbSteps, leaves)
+    return count
+
+
+##########################
+# THE ITERATIVE FUNCTION
+##########################
+
+
+@lru_cache(maxsize=None)
+def SubdivisionMatrices(n):
+    """ Matrices (SL, SR) of the subdivision at 1/2 of a polygon of degree n :
+          left polygon = P @ SL, right polygon = P @ SR for P of shape (2, n+1)
+          SL[i, j] = binom(j, i) / 2^j           (i <= j)
+          SR[i, j] = binom(n-j, i-j) / 2^(n-j)   (i >= j)
+      """
+    SL = np.zeros((n + 1, n + 1))
+    SR = np.zeros((n + 1, n + 1))
+    for j in range(n + 1):
+        for i in range(j + 1):
+            SL[i, j] = comb(j, i) / 2**j
+        for i in range(j, n + 1):
+            SR[i, j] = comb(n - j, i - j) / 2**(n - j)
+    SL.flags.writeable = False
+    SR.flags.writeable = False
+    return SL, SR
+
+
+def BezierIntersectionIterative(xp1, yp1, xp2, yp2, eps, roots, NbSteps=7, leaves=None):
+    """ Same intersection as BezierIntersection on the whole curves,
+          without recursion : the pairs of subdivided polygons waiting
+          to be examined are kept in a stack of preallocated arrays
+              Stack1[k], Stack2[k] : control polygons (2, n+1) of each curve
+              Intervals[k] = (a1, b1, a2, b2)
+          A depth-first search leaves at most 3 pairs per level in the stack,
+          so its size is known from eps. There is no depth limit : an
+          interval too small to be halved in floating point is a leaf. Each subdivision is two matrix
+          products written in place (np.matmul(..., out=...)), and the
+          sub-boxes are min/max reductions into fixed arrays : no array is
+          allocated inside the loop, except by Newton at the leaves.
+          The pairs are examined in the same order as in BezierIntersection.
+          Return the number of pairs examined
+      """
+    P1 = np.array([xp1, yp1], dtype=float)
+    P2 = np.array([xp2, yp2], dtype=float)
+    SL1, SR1 = SubdivisionMatrices(P1.shape[1] - 1)
+    SL2, SR2 = SubdivisionMatrices(P2.shape[1] - 1)
+    # below 2^-1075 the intervals cannot be halved any more
+    depth = min(max(0, ceil(log2(1 / eps))), 1075) if eps > 0 else 1075
+    capacity = 3 * depth + 4
+    Stack1 = np.empty((capacity, 2, P1.shape[1]))
+    Stack2 = np.empty((capacity, 2, P2.shape[1]))
+    Intervals = np.empty((capacity, 4))
+    # the two halves of each curve and their boxes
+    Half1 = np.empty((2, 2, P1.shape[1]))
+    Half2 = np.empty((2, 2, P2.shape[1]))
+    Min1, Max1 = np.empty((2, 2)), np.empty((2, 2))
+    Min2, Max2 = np.empty((2, 2)), np.empty((2, 2))
+
+    Stack1[0], Stack2[0], Intervals[0] = P1, P2, (0, 1, 0, 1)
+    top, count = 1, 0
+    while top:
+        top -= 1
+        count += 1
+        a1, b1, a2, b2 = Intervals[top].tolist()
+        m1, m2 = (a1 + b1) / 2, (a2 + b2) / 2
+        if b1 - a1 <= eps or m1 in (a1, b1):
+            AddRoot(Stack1[top, 0], Stack1[top, 1], (a1, b1),
+                    Stack2[top, 0], Stack2[top, 1], (a2, b2), roots, NbSteps, leaves)
+            continue
+        np.matmul(Stack1[top], SL1, out=Half1[0])
+        np.matmul(Stack1[top], SR1, out=Half1[1])
+        np.matmul(Stack2[top], SL2, out=Half2[0])
+        np.matmul(Stack2[top], SR2, out=Half2[1])
+        np.min(Half1, axis=2, out=Min1)
+        np.max(Half1, axis=2, out=Max1)
+        np.min(Half2, axis=2, out=Min2)
+        np.max(Half2, axis=2, out=Max2)
+        min1, max1, min2, max2 = Min1.tolist(), Max1.tolist(), Min2.tolist(), Max2.tolist()
+        # pushed in reverse order : (1,1) is examined first, then (2,1), (1,2), (2,2)
+        for h1, h2 in ((1, 1), (0, 1), (1, 0), (0, 0)):
+            if (min1[h1][0] <= max2[h2][0] and min2[h2][0] <= max1[h1][0] and
+                    min1[h1][1] <= max2[h2][1] and min2[h2][1] <= max1[h1][1]):
+                Stack1[top] = Half1[h1]
+                Stack2[top] = Half2[h2]
+                Intervals[top] = ((m1, b1) if h1 else (a1, m1)) + ((m2, b2) if h2 else (a2, m2))
+                top += 1
+    return count
+
+
+##########################
+# BEZIER CLIPPING
+##########################
+
+
+def SplitBezier(P, t):
+    """ de Casteljau subdivision of the polygon P (shape (2, n+1)) at t
+          Return the polygons of the parts [0, t] and [t, 1]
+      """
+    n = P.shape[1] - 1
+    left, right = np.empty_like(P), np.empty_like(P)
+    work = P.copy()
+    left[:, 0], right[:, n] = work[:, 0], work[:, n]
+    for j in range(1, n + 1):
+        work = (1 - t) * work[:, :-1] + t * work[:, 1:]
+        left[:, j], right[:, n - j] = work[:, 0], work[:, -1]
+    return left, right
+
+
+def ClipBezier(P, s0, s1):
+    """ Control polygon of the part [s0, s1] of the curve of polygon P """
+    if s1 < 1:
+        P = SplitBezier(P, s1)[0]
+    if s0 > 0:
+        P = SplitBezier(P, s0 / s1)[1]
+    return P
+
+
+def FatLine(Q):
+    """ Fat line of the curve of polygon Q : (point, unit normal, dmin, dmax)
+          The line goes through the first and last control points (or the
+          first point and the farthest one for a closed polygon) ;
+          every point of the curve is at a signed distance in [dmin, dmax]
+      """
+    origin = Q[:, 0]
+    direction = Q[:, -1] - origin
+    if not direction.any():
+        direction = Q[:, np.argmax(np.abs(Q - origin[:, None]).sum(axis=0))] - origin
+        if not direction.any():
+            direction = np.array([1., 0.])
+    normal = np.array([-direction[1], direction[0]]) / np.hypot(*direction)
+    distances = normal @ (Q - origin[:, None])
+    return origin, normal, min(0., distances.min()), max(0., distances.max())
+
+
+def ClipInterval(P, fatline):
+    """ Part [tmin, tmax] of [0,1] where the curve of polygon P may be inside
+          the fat line, None if the curve is outside
+          The distance to the line is a Bezier function of control points
+          (i/n, d_i) : the curve is outside the fat line where the convex hull
+          of these points is outside the strip dmin <= d <= dmax. The bounds of
+          the hull inside the strip are among the points inside the strip and
+          the crossings of the segments between two points with the strip edges.
+      """
+    origin, normal, dmin, dmax = fatline
+    d = normal @ (P - origin[:, None])
+    t = np.linspace(0, 1, len(d))
+    candidates = [t[(d >= dmin) & (d <= dmax)]]
+    i, j = np.triu_indices(len(d), 1)
+    for level in (dmin, dmax):
+        crossing = (d[i] - level) * (d[j] - level) < 0
+        ci, cj = i[crossing], j[crossing]
+        candidates.append(t[ci] + (level - d[ci]) * (t[cj] - t[ci]) / (d[cj] - d[ci]))
+    candidates = np.concatenate(candidates)
+    if len(candidates) == 0:
+        return None
+    return max(0., candidates.min()), min(1., candidates.max())
+
+
+def LeafInterval(I, eps):
+    """ Interval of length eps (if possible) centered on I, inside [0,1] """
+    middle = min(max((I[0] + I[1]) / 2, eps / 2), 1 - eps / 2)
+    return max(0., middle - eps / 2), min(1., middle + eps / 2)
+
+
+def BezierClipping(xp1, yp1, xp2, yp2, eps, roots, NbSteps=7, leaves=None):
+    """ Intersection of the whole curves by Bezier clipping
+          (T. W. Sederberg, T. Nishita, 1990) :
+          each curve is in turn cut down to the part that may be inside
+          the fat line of the other one. Near a transversal intersection the
+          intervals shrink quadratically. When a clipping keeps more than 80%
+          of the interval (several intersections, or tangency) the curve of
+          largest interval is halved, as in BezierIntersection.
+          When both intervals are smaller than eps, Newton method gives the root.
+          Return the number of clippings and halvings
+      """
+    Curve1 = np.array([xp1, yp1], dtype=float)
+    Curve2 = np.array([xp2, yp2], dtype=float)
+    # rounding margin of the exclusion tests : a curve clipped down to a point
+    # is only known up to the rounding errors of the subdivisions
+    tol = 1e-10 * max(1., np.abs(Curve1).max(), np.abs(Curve2).max())
+    stack = [(Curve1, Curve2, (0., 1.), (0., 1.), 0)]
+    count = 0
+    while stack:
+        P1, P2, I1, I2, turn = stack.pop()
+        count += 1
+        if max(I1[1] - I1[0], I2[1] - I2[0]) <= eps:
+            # the clipped intervals may be reduced to a point, where Newton
+            # cannot work (and where rounding may separate the boxes) :
+            # it is run on intervals of length eps around them
+            I1, I2 = LeafInterval(I1, eps), LeafInterval(I2, eps)
+            AddRoot(*ClipBezier(Curve1, *I1), I1, *ClipBezier(Curve2, *I2), I2,
+                    roots, NbSteps, leaves)
+            continue
+        if (P1[0].min() > P2[0].max() + tol or P2[0].min() > P1[0].max() + tol or
+                P1[1].min() > P2[1].max() + tol or P2[1].min() > P1[1].max() + tol):
+            continue
+        if turn:  # always clip the first curve of the record
+            P1, P2, I1, I2 = P2, P1, I2, I1
+        origin, normal, dmin, dmax = FatLine(P2)
+        clip = ClipInterval(P1, (origin, normal, dmin - tol, dmax + tol))
+        if clip is None:
+            continue
+        s0, s1 = clip
+        a, b = I1
+        P1, I1 = ClipBezier(P1, s0, s1), (a + s0 * (b - a), a + s1 * (b - a))
+        if s1 - s0 > 0.8:
+            # no real progress : the curve of largest interval is halved
+            if I1[1] - I1[0] < I2[1] - I2[0]:
+                P1, P2, I1, I2, turn = P2, P1, I2, I1, 1 - turn
+            middle = (I1[0] + I1[1]) / 2
+            left, right = SplitBezier(P1, 0.5)
+            for half, interval in ((right, (middle, I1[1])), (left, (I1[0], middle))):
+                if turn:
+                    stack.append((P2, half, I2, interval, 1))
+                else:
+                    stack.append((half, P2, interval, I2, 0))
+            continue
+        if turn:
+            stack.append((P2, P1, I2, I1, 0))
+        else:
+            stack.append((P1, P2, I1, I2, 1))
+    return count
+
+
+#######################
+#  COMPUTE API
+#######################
+
+
+def _Recursive(xp1, yp1, xp2, yp2, eps, roots, NbSteps, leaves):
+    """ BezierIntersection on the whole curves """
+    return BezierIntersection(xp1, yp1, [0, 1], xp2, yp2, [0, 1], eps, roots,
+                              NbSteps, leaves)
+
+
+# name -> function(xp1, yp1, xp2, yp2, eps, roots, NbSteps, leaves)
+# returning its number of iterations
+Methods = {
+    "recursive": _Recursive,
+    "iterative": BezierIntersectionIterative,
+    "clipping": BezierClipping,
+}
+
+
+def IntersectBezierCurves(xp1, yp1, xp2, yp2, eps=0.002, NbSteps=7, err=1e-4, leaves=None,
+                          method="iterative", merge=None):
+    """ Intersections of the Bezier curves of control points (xp1, yp1)
+          and (xp2, yp2), method being a key of Methods
+          If merge is a distance, the roots closer than merge (in u and v)
+          are merged by RootStore.Merge
+          If leaves is a list, it receives the last subdivided polygons of
+          each intersection, in the same order as the roots
+          Return the arrays u, v, x, y (one entry per intersection, sorted by u)
+      """
+    if method not in Methods:
+        raise ValueError(f"unknown method {method!r} (choose among {', '.join(Methods)})")
+    xp1, yp1 = np.asarray(xp1, dtype=float), np.asarray(yp1, dtype=float)
+    xp2, yp2 = np.asarray(xp2, dtype=float), np.asarray(yp2, dtype=float)
+    roots = RootStore(err)
+    # the polygons of these curves only (leaves may already hold others)
+    new_leaves = None if leaves is None else []
+    if IntersectBox2D(MinMaxBoxCP(xp1, yp1), MinMaxBoxCP(xp2, yp2))[0]:
+        Methods[method](xp1, yp1, xp2, yp2, eps, roots, NbSteps, new_leaves)
+    if merge is not None:
+        roots.Merge(xp1, yp1, xp2, yp2, merge, NbSteps, new_leaves)
+    roots.Sort(new_leaves)
+    if leaves is not None:
+        leaves.extend(new_leaves)
+    u, v, x, y = np.array(roots, dtype=float).reshape(-1, 4).T
+    return u, v, x, y
+
+
+def IntersectBezierPairs(pairs, eps=0.002, NbSteps=7, err=1e-4, method="iterative",
+                         merge=None):
+    """ Batch version : pairs is an iterable of ((xp1, yp1), (xp2, yp2))
+          Return the list of the (u, v, x, y) of each pair
+      """
+    return [IntersectBezierCurves(xp1, yp1, xp2, yp2, eps, NbSteps, err, method=method,
+                                  merge=merge)
+            for (xp1, yp1), (xp2, yp2) in pairs]
+
+
+#################################################
+# NEWTON FUNCTIONS
+#################################################
+
+
+def BezierDerivative1D(PC, t0):
+    """ PC : list of scalar values (control points)
+          Return value P'(t0) of the Bézier function 
+      """
+    return BezierDerivatives(PC, t0)[0]
+
+
+def BezierValue1D(PC, t0):
+    """ PC : list of scalar values (control points)
+          Return value P(t0) of the Bézier function
+      """
+    return BezierValues(PC, t0)[0]
+
+
+def Newton2Var(xp1, yp1, I1, xp2, yp2, I2, NbSteps):
+    # initial values
+    u0 = (I1[0] + I1[1]) / 2.
+    v0 = (I2[0] + I2[1]) / 2.
+    X0 = np.array([u0, v0])
+    P1 = np.array([xp1, yp1], dtype=float)
+    P2 = np.array([xp2, yp2], dtype=float)
+
+    # a singular Jacobian (tangent curves) or a divergence gives inf or nan,
+    # rejected by the callers
+    with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+        for k in range(NbSteps):
+            u0 = X0[0]
+            v0 = X0[1]
+            # columns : (x, y) value and (x', y') derivative of each curve
+            V1 = P1 @ np.hstack(BernsteinValuesAndDerivatives(P1.shape[1] - 1, u0))
+            V2 = P2 @ np.hstack(BernsteinValuesAndDerivatives(P2.shape[1] - 1, v0))
+            # Inverse D of Jacobian matrix : D = J^-1
+            D = np.array([[-V2[1, 1], V2[0, 1]],
+                          [-V1[1, 1], V1[0, 1]]])
+            D = D / np.linalg.det(D)
+            # Second member
+            b = V1[:, 0] - V2[:, 0]
+            # recurrence
+            X0 = X0 - np.dot(D, b)
+    return X0
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+
+"""
+Traitement d'un grand nombre d'instances en parallele.
+Chaque instance donne une ligne JSON :
+{"instance": ..., "points": n, "pair": [[x1, y1], [x2, y2]], "distance": d,
+ "timings": {"load": s, "sort": s, "solve": s}}
+utilisation : ./batch.py [-j processus] [-o sortie.jsonl] dossier_ou_motif...
+"""
+
+import argparse
+import json
+import os
+from glob import glob
+from multiprocessing import Pool
+from sys import stdout
+from time import perf_counter
+import numpy as np
+
+from closest_array import trier_par_x, _find_rec
+from loader import load_coordinates
+
+
+def lister_instances(chemins):
+    """Dossiers -> leurs fichiers .pts, motifs -> fichiers correspondants"""
+    instances = []
+    for chemin in chemins:
+        if os.path.isdir(chemin):
+            instances.extend(sorted(glob(os.path.join(chemin, "*.pts"))))
+        else:
+            instances.extend(sorted(glob(chemin)))
+    return instances
+
+
+def resoudre(instance, cache=False):
+    """Resout une instance, retourne le dictionnaire de la ligne JSON"""
+    try:
+        debut = perf_counter()
+        coords = np.asarray(load_coordinates(instance, cache))
+        chargement = perf_counter()
+        if len(coords) < 2:
+            raise ValueError("il faut au moins deux points")
+        ordre, xs, ys = trier_par_x(coords)
+        tri = perf_counter()
+        i, j, d2 = _find_rec(xs, ys, 0, len(coords))
+        fin = perf_counter()
+    except (OSError, ValueError) as erreur:
+        return {"instance": instance, "error": str(erreur)}
+    return {
+        "instance": instance,
+        "points": len(coords),
+        "pair": [coords[ordre[i]].tolist(), coords[ordre[j]].tolist()],
+        "distance": float(np.sqrt(d2)),
+        "timings": {"load": chargement - debut, "sort": tri - chargement, "solve": fin - tri},
+    }
+
+
+def _resoudre(arguments):
+    """resoudre pour Pool.imap_unordered"""
+    return resoudre(*arguments)
+
+
+def main():
+    """Lance le pool et ecrit les lignes JSON au fur et a mesure"""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("chemins", nargs="+", help="dossiers ou motifs glob d'instances .pts")
+    parser.add_argument("-j", "--processus", type=int, default=os.cpu_count())
+    parser.add_argument("-o", "--sortie", help="fichier JSON lines (sortie standard par defaut)")
+    parser.add_argument("--cache", action="store_true", help="utiliser les caches .f64 de loader")
+    options = parser.parse_args()
+
+    instances = lister_instances(options.chemins)
+    sortie = open(options.sortie, "w") if options.sortie else stdout
+    try:
+        with Pool(options.processus) as pool:
+            taches = ((instance, options.cache) for instance in instances)
+            for ligne in pool.imap_unordered(_resoudre, taches):
+                sortie.write(json.dumps(ligne) + "\n")
+                sortie.flush()
+    finally:
+        if sortie is not stdout:
+            sortie.close()
+
+
+if __name__ == "__main__":
+    main()
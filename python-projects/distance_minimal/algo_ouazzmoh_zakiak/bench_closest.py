@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+
+"""
+Comparaison de main.find_rec et de closest_array.closest_pair
+sur des nuages uniformes de 10^4 a 10^7 points.
+utilisation : ./bench_closest.py [taille_max_find_rec]
+"""
+
+from sys import argv, setrecursionlimit
+from time import perf_counter
+import numpy as np
+
+from geo.point import Point
+from main import find_rec
+from closest_array import closest_pair
+
+
+TAILLES = [10**4, 10**5, 10**6, 10**7]
+
+
+def temps_find_rec(coords):
+    """Tri + find_rec comme print_solution, retourne (paire, secondes)"""
+    points = [Point((x, y)) for x, y in coords.tolist()]
+    debut = perf_counter()
+    points.sort(key=lambda point: point.coordinates[0])
+    ptmin = find_rec(points)
+    duree = perf_counter() - debut
+    return {tuple(p.coordinates) for p in ptmin}, duree
+
+
+def temps_numpy(coords):
+    """closest_pair sur le tableau, retourne (paire, secondes)"""
+    debut = perf_counter()
+    i, j = closest_pair(coords)
+    duree = perf_counter() - debut
+    return {tuple(coords[i].tolist()), tuple(coords[j].tolist())}, duree
+
+
+def main():
+    """Affiche un tableau taille / find_rec / numpy / acceleration"""
+    taille_max_rec = int(argv[1]) if len(argv) > 1 else 10**6
+    setrecursionlimit(10000)
+    generateur = np.random.default_rng(0)
+    print(f"{'N':>10} {'find_rec (s)':>14} {'numpy (s)':>10} {'gain':>8}")
+    for taille in TAILLES:
+        coords = generateur.uniform(0, 1, (taille, 2))
+        paire_np, duree_np = temps_numpy(coords)
+        if taille > taille_max_rec:
+            print(f"{taille:>10} {'-':>14} {duree_np:>10.3f} {'-':>8}")
+            continue
+        paire_rec, duree_rec = temps_find_rec(coords)
+        assert paire_rec == paire_np, "les deux methodes different"
+        print(f"{taille:>10} {duree_rec:>14.3f} {duree_np:>10.3f} {duree_rec/duree_np:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
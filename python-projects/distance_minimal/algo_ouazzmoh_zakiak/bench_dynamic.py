@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+
+"""
+Mises a jour de geo.dynamic_pair contre un recalcul complet a chaque image.
+A chaque image on retire et on ajoute quelques points.
+utilisation : ./bench_dynamic.py [nombre_de_points] [nombre_d_images] [points_par_image]
+"""
+
+from sys import argv
+from math import hypot
+from random import random, sample, seed
+from time import perf_counter
+import numpy as np
+
+from geo.point import Point
+from geo.dynamic_pair import DynamicClosestPair
+from closest_array import closest_pair
+
+
+def main():
+    """Temps moyen par image des deux methodes"""
+    nombre = int(argv[1]) if len(argv) > 1 else 10**5
+    images = int(argv[2]) if len(argv) > 2 else 50
+    par_image = int(argv[3]) if len(argv) > 3 else 5
+    seed(0)
+    points = [Point((random(), random())) for _ in range(nombre)]
+
+    debut = perf_counter()
+    dynamique = DynamicClosestPair(points)
+    print(f"{nombre} points, construction : {perf_counter() - debut:.2f}s")
+    vivants = dict(enumerate(points))
+
+    duree_dynamique = duree_complet = 0
+    for _ in range(images):
+        retires = sample(list(vivants), par_image)
+        ajouts = [Point((random(), random())) for _ in range(par_image)]
+
+        debut = perf_counter()
+        for cle in retires:
+            dynamique.remove(cle)
+        cles = [dynamique.insert(point) for point in ajouts]
+        distance = dynamique.closest_pair()[2]
+        duree_dynamique += perf_counter() - debut
+
+        for cle in retires:
+            del vivants[cle]
+        vivants.update(zip(cles, ajouts))
+        coords = np.array([p.coordinates for p in vivants.values()])
+        debut = perf_counter()
+        i, j = closest_pair(coords)
+        duree_complet += perf_counter() - debut
+        assert distance == hypot(*(coords[i] - coords[j])), "les deux methodes different"
+
+    print(f"{images} images de {par_image} retraits + {par_image} ajouts")
+    print(f"dynamique       : {1000 * duree_dynamique / images:8.3f} ms par image")
+    print(f"recalcul numpy  : {1000 * duree_complet / images:8.3f} ms par image")
+
+
+if __name__ == "__main__":
+    main()
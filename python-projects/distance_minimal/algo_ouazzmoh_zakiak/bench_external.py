@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+
+"""
+Verification de closest_external sur un fichier synthetique
+plusieurs fois plus gros que le budget memoire.
+Sort en erreur si le pic depasse MARGE fois le budget
+ou si la paire differe de celle de closest_array.
+utilisation : ./bench_external.py [nombre_de_points] [budget_en_mo]
+"""
+
+import os
+import resource
+from multiprocessing import get_context
+from sys import argv, exit
+from tempfile import TemporaryDirectory
+from time import perf_counter
+import numpy as np
+
+from closest_array import closest_pair
+from closest_external import closest_pair_external
+from loader import load_coordinates
+
+MARGE = 4 #pic de memoire toleree, en multiples du budget
+
+
+def generer(chemin, nombre, taille_bloc=10**6):
+    """Ecrit nombre points uniformes au format "x, y" sans tout garder en memoire"""
+    generateur = np.random.default_rng(0)
+    with open(chemin, "w") as fichier:
+        for debut in range(0, nombre, taille_bloc):
+            bloc = generateur.uniform(0, 1000, (min(taille_bloc, nombre - debut), 2))
+            np.savetxt(fichier, bloc, fmt="%.17g", delimiter=", ")
+
+
+def mesurer(chemin, budget, dossier):
+    """Lance le mode externe, retourne (resultat, secondes, memoire avant et pic en Mo)"""
+    avant = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    debut = perf_counter()
+    resultat = closest_pair_external(chemin, budget, dossier)
+    duree = perf_counter() - debut
+    return resultat, duree, avant, resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def main():
+    """Pic de memoire du mode externe, puis comparaison avec closest_array"""
+    nombre = int(argv[1]) if len(argv) > 1 else 5 * 10**6
+    budget = int(argv[2]) * 2**20 if len(argv) > 2 else 16 * 2**20
+    with TemporaryDirectory() as dossier:
+        chemin = os.path.join(dossier, "synthetique.pts")
+        generer(chemin, nombre)
+        print(f"{nombre} points, {os.path.getsize(chemin) / 2**20:.0f} Mo de texte, "
+              f"{16 * nombre / 2**20:.0f} Mo en float64, budget {budget / 2**20:.0f} Mo")
+
+        #Processus neuf pour que le pic de memoire ne compte que le mode externe
+        with get_context("spawn").Pool(1) as pool:
+            resultat, duree, avant, pic = pool.apply(mesurer, (chemin, budget, dossier))
+        point_1, point_2, distance = resultat
+        print(f"externe : {duree:.1f}s, pic de memoire {pic:.0f} Mo dont {avant:.0f} Mo avant le calcul")
+        if pic - avant > MARGE * budget / 2**20:
+            exit(f"echec : {pic - avant:.0f} Mo pendant le calcul, plus de {MARGE} fois le budget")
+
+        #La reference charge tout, donc apres la mesure
+        coords = load_coordinates(chemin)
+        i, j = closest_pair(coords)
+        if {point_1, point_2} != {tuple(coords[i].tolist()), tuple(coords[j].tolist())}:
+            exit(f"echec : paire {point_1}, {point_2} differente de closest_array")
+        print(f"meme paire que closest_array, distance {distance}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+
+"""
+Comparaison de geo.grid.GridIndex et de la recherche naive.
+utilisation : ./bench_grid.py [nombre_de_points] [nombre_de_requetes]
+"""
+
+from sys import argv
+from random import random, seed
+from time import perf_counter
+
+from geo.point import Point
+from geo.grid import GridIndex
+from main import recherche_brutforce
+
+
+def distance_carre(point_1, point_2):
+    """Distance au carre sans passer par Point.distance_to"""
+    (x_1, y_1), (x_2, y_2) = point_1.coordinates, point_2.coordinates
+    return (x_1 - x_2)**2 + (y_1 - y_2)**2
+
+
+def chronometre(fonction, *arguments):
+    """Retourne (resultat, secondes)"""
+    debut = perf_counter()
+    resultat = fonction(*arguments)
+    return resultat, perf_counter() - debut
+
+
+def main():
+    """Plus proche voisin, paires a distance < d et paire minimale"""
+    nombre = int(argv[1]) if len(argv) > 1 else 2000
+    requetes = int(argv[2]) if len(argv) > 2 else 1000
+    seed(0)
+    points = [Point((random(), random())) for _ in range(nombre)]
+    cibles = [Point((random(), random())) for _ in range(requetes)]
+
+    index, duree_index = chronometre(GridIndex, points)
+    print(f"{nombre} points, construction de l'index : {duree_index:.3f}s")
+
+    naif, duree_naif = chronometre(
+        lambda: [min(points, key=lambda p, q=q: distance_carre(p, q)) for q in cibles])
+    grille, duree_grille = chronometre(lambda: [index.nearest(q)[0] for q in cibles])
+    assert all(distance_carre(a, q) == distance_carre(b, q)
+               for a, b, q in zip(naif, grille, cibles))
+    print(f"{requetes} plus proches voisins : naif {duree_naif:.3f}s, grille {duree_grille:.3f}s")
+
+    ptmin, duree_naif = chronometre(recherche_brutforce, points)
+    d_min = ptmin[0].distance_to(ptmin[1])
+    #Toutes les paires a moins de 2 d_min, la paire minimale doit en faire partie
+    paires, duree_grille = chronometre(index.pairs_within, 2 * d_min)
+    meilleure = min(paires, key=lambda paire: distance_carre(*paire))
+    assert distance_carre(*meilleure) == distance_carre(*ptmin)
+    print(f"paire minimale : recherche_brutforce {duree_naif:.3f}s, "
+          f"grille {duree_grille:.3f}s ({len(paires)} paires a moins de 2 d_min)")
+
+
+if __name__ == "__main__":
+    main()
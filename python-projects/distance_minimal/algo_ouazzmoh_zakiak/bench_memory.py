@@ -0,0 +1,41 @@
+#!/usr/bin/env python3
+
+"""
+Memoire occupee par N points : liste de Point (comme load_instance)
+contre un PointArray.
+utilisation : ./bench_memory.py [nombre_de_points]
+"""
+
+from sys import argv
+from random import random
+import tracemalloc
+
+from geo.point import Point
+from geo.point_array import PointArray
+
+
+def mesurer(construire):
+    """Octets alloues (et non liberes) par construire()"""
+    tracemalloc.start()
+    avant = tracemalloc.get_traced_memory()[0]
+    resultat = construire()
+    apres = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del resultat
+    return apres - avant
+
+
+def main():
+    """Affiche les octets par point de chaque representation"""
+    nombre = int(argv[1]) if len(argv) > 1 else 10**6
+    coordonnees = [(random(), random()) for _ in range(nombre)]
+    liste = mesurer(lambda: [Point((float(x), float(y))) for x, y in coordonnees])
+    tableau = mesurer(lambda: PointArray(c for point in coordonnees for c in point))
+    print(f"{nombre} points")
+    print(f"liste de Point : {liste/nombre:7.1f} octets par point")
+    print(f"PointArray     : {tableau/nombre:7.1f} octets par point")
+    print(f"gain           : {liste/tableau:7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
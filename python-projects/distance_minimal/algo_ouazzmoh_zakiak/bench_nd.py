@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+
+"""
+closest_nd en dimension 2 a 10 : verification contre recherche_brutforce
+sur de petits nuages, puis temps pour des tailles croissantes.
+Sur des points uniformes en dimension 8 et 10 l'arbre n'elague plus et
+la grille prend le relais : 2 a 5s pour 10^5 points, 20 a 30s (d=8) et
+60 a 90s (d=10) pour 10^6 points. Le cout reste superlineaire (l'arbre
+seul prenait deja 12s pour 4.10^4 points en dimension 10).
+utilisation : ./bench_nd.py [taille_max]
+"""
+
+from sys import argv
+from time import perf_counter
+import numpy as np
+
+from geo.point import Point
+from main import recherche_brutforce
+from closest_nd import closest_pair_nd
+
+
+DIMENSIONS = [2, 3, 8, 10]
+
+
+def uniforme(taille, dimension, generateur):
+    """Points uniformes dans le cube unite"""
+    return generateur.uniform(0, 1, (taille, dimension))
+
+
+def amas(taille, dimension, generateur):
+    """Amas gaussiens (environ 1000 points chacun) sur un sous-espace de dimension 3"""
+    base = generateur.normal(0, 1, (3, dimension))
+    centres = generateur.uniform(0, 1, (max(1, taille // 1000), 3))
+    choix = generateur.integers(0, len(centres), taille)
+    return (centres[choix] + generateur.normal(0, 0.01, (taille, 3))) @ base
+
+
+def verifier(generateur):
+    """closest_pair_nd et recherche_brutforce trouvent la meme distance"""
+    for dimension in DIMENSIONS:
+        for nuage in (uniforme, amas):
+            coords = nuage(500, dimension, generateur)
+            ptmin = recherche_brutforce([Point(tuple(c)) for c in coords.tolist()])
+            _, _, distance = closest_pair_nd(coords)
+            assert np.isclose(distance, ptmin[0].distance_to(ptmin[1]), rtol=1e-12, atol=0)
+    print("closest_pair_nd == recherche_brutforce sur 500 points")
+
+
+def main():
+    """Tableau des temps par dimension et par taille"""
+    taille_max = int(argv[1]) if len(argv) > 1 else 10**6
+    generateur = np.random.default_rng(0)
+    verifier(generateur)
+    for nuage in (amas, uniforme):
+        print(nuage.__name__)
+        for dimension in DIMENSIONS:
+            taille = 10**4
+            while taille <= taille_max:
+                coords = nuage(taille, dimension, generateur)
+                debut = perf_counter()
+                closest_pair_nd(coords)
+                duree = perf_counter() - debut
+                print(f"  d={dimension:<3} N={taille:<9} {duree:8.2f}s", flush=True)
+                taille *= 10
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+
+"""
+Acceleration de closest_parallel en fonction du nombre de processus.
+utilisation : ./bench_parallel.py [nombre_de_points]
+"""
+
+import os
+from sys import argv
+from time import perf_counter
+import numpy as np
+
+from closest_array import closest_pair
+from closest_parallel import closest_pair_parallel
+
+
+def comparer(nom, coords, processus):
+    """closest_pair_parallel et closest_pair donnent la meme distance"""
+    distances = []
+    for paire in (closest_pair(coords), closest_pair_parallel(coords, processus)):
+        distances.append(np.hypot(*(coords[paire[0]] - coords[paire[1]])))
+    assert distances[0] == distances[1], f"{nom} : {distances[1]} au lieu de {distances[0]}"
+    print(f"{nom} de {len(coords)} points, {processus} processus : "
+          f"d_min = {distances[0]:.3f} dans les deux cas")
+
+
+def nuage_trois_x(taille=300000):
+    """Les x ne prennent que trois valeurs : les tranches sont plus etroites que
+    d_min et la paire la plus proche relie la premiere et la derniere tranche"""
+    generateur = np.random.default_rng(1)
+    coords = np.column_stack((generateur.choice([0, 1e-9, 2e-9], taille),
+                              generateur.permutation(taille).astype(np.float64)))
+    coords[0], coords[-1] = (0, coords[0, 1]), (2e-9, coords[0, 1] + 0.25)
+    return coords
+
+
+def nuage_colonnes(colonnes=16, hauteur=12500):
+    """Colonnes x = c de points y = 20 n + 0.6 c, plus un point special par colonne
+    en bas : dans une bande couvrant plusieurs tranches, la paire la plus proche
+    est a plus de VOISINS rangs d'ecart dans l'ordre des y"""
+    coords = []
+    for colonne in range(colonnes):
+        if colonne == 0:
+            special = -50
+        elif colonne == 1:
+            special = -49.9
+        elif colonne % 2:
+            special = -50 + 0.01*((colonne - 1)//2)
+        else:
+            special = -200 - colonne
+        ys = np.append(20*np.arange(hauteur - 1) + 0.6*colonne, special)
+        coords.append(np.column_stack((np.full(hauteur, float(colonne)), ys)))
+    return np.concatenate(coords)
+
+
+def verifier_nuage_degenere():
+    """Nuages degeneres ou des tranches etroites cassent un recollement naif"""
+    comparer("nuage a trois x", nuage_trois_x(), 4)
+    comparer("nuage en colonnes", nuage_colonnes(), 16)
+
+
+def main():
+    """Temps et acceleration pour 1, 2, 4, ... processus jusqu'au nombre de coeurs"""
+    verifier_nuage_degenere()
+    taille = int(argv[1]) if len(argv) > 1 else 10**7
+    coords = np.random.default_rng(0).uniform(0, 1, (taille, 2))
+    debut = perf_counter()
+    reference = set(closest_pair(coords))
+    duree_seq = perf_counter() - debut
+    print(f"{taille} points, {os.cpu_count()} coeurs, sequentiel : {duree_seq:.2f}s")
+    processus = 2
+    while processus <= os.cpu_count():
+        debut = perf_counter()
+        paire = set(closest_pair_parallel(coords, processus))
+        duree = perf_counter() - debut
+        assert paire == reference, "le resultat parallele differe"
+        print(f"{processus:>4} processus : {duree:.2f}s, acceleration {duree_seq/duree:.1f}x")
+        processus *= 2
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,42 @@
+#!/usr/bin/env python3
+
+"""
+Passage a l'echelle : find_rec (O(n log n)) contre recherche_aleatoire (O(n) en moyenne).
+utilisation : ./bench_random.py [taille_max]
+"""
+
+from sys import argv
+from random import random, seed
+from time import perf_counter
+
+from geo.point import Point
+from main import diviser_pour_regner
+from closest_random import recherche_aleatoire
+
+
+def chronometre(algorithme, points):
+    """Retourne (distance trouvee, secondes) sur une copie de la liste"""
+    points = list(points)
+    debut = perf_counter()
+    ptmin = algorithme(points)
+    return ptmin[0].distance_to(ptmin[1]), perf_counter() - debut
+
+
+def main():
+    """Affiche le temps par point de chaque algorithme pour des tailles croissantes"""
+    taille_max = int(argv[1]) if len(argv) > 1 else 10**6
+    seed(0)
+    taille = 1000
+    print(f"{'N':>9} {'rec (s)':>9} {'alea (s)':>9} {'rec/N (us)':>11} {'alea/N (us)':>12}")
+    while taille <= taille_max:
+        points = [Point((random(), random())) for _ in range(taille)]
+        d_rec, duree_rec = chronometre(diviser_pour_regner, points)
+        d_alea, duree_alea = chronometre(recherche_aleatoire, points)
+        assert d_rec == d_alea, "les deux algorithmes different"
+        print(f"{taille:>9} {duree_rec:>9.3f} {duree_alea:>9.3f}"
+              f" {1e6*duree_rec/taille:>11.2f} {1e6*duree_alea/taille:>12.2f}")
+        taille *= 4
+
+
+if __name__ == "__main__":
+    main()
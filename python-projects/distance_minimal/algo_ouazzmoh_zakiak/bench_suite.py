@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+
+"""
+Banc d'essai de la paire la plus proche sur les nuages de clouds.py.
+Pour chaque distribution et chaque taille (10^3 a 10^7) :
+- verification de find_rec contre recherche_brutforce (petites tailles)
+- temps et pic de memoire de find_rec et de closest_array
+Le rapport JSON peut etre compare a celui d'une version precedente.
+utilisation : ./bench_suite.py [-o rapport.json] [--compare ancien.json]
+"""
+
+import argparse
+import json
+from sys import setrecursionlimit
+from time import perf_counter
+import tracemalloc
+import numpy as np
+
+from geo.point import Point
+from main import find_rec, recherche_brutforce
+from closest_array import closest_pair
+from clouds import DISTRIBUTIONS
+
+
+TAILLES = [10**3, 10**4, 10**5, 10**6, 10**7]
+
+
+def find_rec_trie(coords):
+    """Comme print_solution : construction des Point, tri par x, find_rec"""
+    points = [Point((x, y)) for x, y in coords.tolist()]
+    points.sort(key=lambda point: point.coordinates[0])
+    ptmin = find_rec(points)
+    return ptmin[0].distance_to(ptmin[1])
+
+
+def closest_array_distance(coords):
+    """closest_pair puis distance de la paire"""
+    i, j = closest_pair(coords)
+    return Point(tuple(coords[i].tolist())).distance_to(Point(tuple(coords[j].tolist())))
+
+
+def mesurer(fonction, coords):
+    """Retourne (resultat, secondes, pic de memoire en octets), en deux passes"""
+    debut = perf_counter()
+    resultat = fonction(coords)
+    duree = perf_counter() - debut
+    #tracemalloc ralentit le code python, le pic est mesure a part
+    tracemalloc.start()
+    fonction(coords)
+    pic = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return resultat, duree, pic
+
+
+def verifier(coords):
+    """find_rec et recherche_brutforce trouvent-ils la meme distance ?
+    recherche_brutforce ignore les distances nulles, pas find_rec ni closest_array :
+    avec des doublons la distance attendue est donc 0"""
+    if len(np.unique(coords, axis=0)) < len(coords):
+        return find_rec_trie(coords) == 0
+    points = [Point((x, y)) for x, y in coords.tolist()]
+    ptmin = recherche_brutforce(points)
+    return find_rec_trie(coords) == ptmin[0].distance_to(ptmin[1])
+
+
+def lancer(taille_max, taille_max_rec, taille_max_verif):
+    """Retourne le rapport {distribution: {taille: mesures}}"""
+    rapport = {}
+    for nom, generer in DISTRIBUTIONS.items():
+        rapport[nom] = {}
+        for taille in (t for t in TAILLES if t <= taille_max):
+            coords = generer(taille)
+            mesures = {}
+            if taille <= taille_max_verif:
+                mesures["find_rec_correct"] = verifier(coords)
+            if taille <= taille_max_rec:
+                distance, duree, pic = mesurer(find_rec_trie, coords)
+                mesures["find_rec"] = {"distance": distance, "temps": duree, "memoire": pic}
+            distance, duree, pic = mesurer(closest_array_distance, coords)
+            mesures["closest_array"] = {"distance": distance, "temps": duree, "memoire": pic}
+            rapport[nom][str(taille)] = mesures
+            print(f"{nom:>9} {taille:>9}", json.dumps(mesures))
+    return rapport
+
+
+def comparer(ancien, nouveau):
+    """Affiche les variations de temps et de memoire entre deux rapports"""
+    for nom, tailles in nouveau.items():
+        for taille, mesures in tailles.items():
+            for methode in ("find_rec", "closest_array"):
+                avant = ancien.get(nom, {}).get(taille, {}).get(methode)
+                apres = mesures.get(methode)
+                if avant is None or apres is None:
+                    continue
+                print(f"{nom:>9} {taille:>9} {methode:>13} "
+                      f"temps {apres['temps']/avant['temps']:6.2f}x "
+                      f"memoire {apres['memoire']/max(avant['memoire'], 1):6.2f}x"
+                      f"{'' if apres['distance'] == avant['distance'] else '  DISTANCE DIFFERENTE'}")
+
+
+def main():
+    """Lance le banc d'essai, ecrit et compare les rapports"""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("-o", "--sortie", default="rapport.json")
+    parser.add_argument("--compare", help="rapport d'une version precedente")
+    parser.add_argument("--taille-max", type=int, default=10**6)
+    parser.add_argument("--taille-max-rec", type=int, default=10**5,
+                        help="find_rec (objets Point) seulement jusqu'a cette taille")
+    parser.add_argument("--taille-max-verif", type=int, default=10**3,
+                        help="recherche_brutforce seulement jusqu'a cette taille")
+    options = parser.parse_args()
+
+    setrecursionlimit(10000)
+    rapport = lancer(options.taille_max, options.taille_max_rec, options.taille_max_verif)
+    with open(options.sortie, "w") as fichier:
+        json.dump(rapport, fichier, indent=1, sort_keys=True)
+    if options.compare:
+        with open(options.compare) as fichier:
+            comparer(json.load(fichier), rapport)
+
+
+if __name__ == "__main__":
+    main()
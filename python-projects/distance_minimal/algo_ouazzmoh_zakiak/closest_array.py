@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+
+"""
+Diviser pour regner sur un tableau numpy (N, 2) de float64.
+Meme algorithme que main.find_rec mais sans objets Point :
+un seul tri par x, recursion sur des indices et bande verifiee par blocs.
+"""
+
+from functools import lru_cache
+import numpy as np
+
+
+FEUILLE = 128 #En dessous de cette taille on fait du brutforce vectorise
+VOISINS = 7 #Nombre de voisins a tester dans la bande triee par y
+
+
+@lru_cache(maxsize=None)
+def _masque(taille):
+    """Masque des cases (i, j) avec j <= i, a ignorer dans le brutforce"""
+    return np.tri(taille, dtype=bool)
+
+
+def _brutforce(xs, ys, debut, fin):
+    """Brutforce vectorise sur xs[debut:fin], retourne (i, j, d2)"""
+    x, y = xs[debut:fin], ys[debut:fin]
+    dx = x[None, :] - x[:, None]
+    dy = y[None, :] - y[:, None]
+    carres = dx*dx + dy*dy
+    carres[_masque(fin - debut)] = np.inf
+    i, j = divmod(int(np.argmin(carres)), fin - debut)
+    return debut + i, debut + j, float(carres[i, j])
+
+
+def _find_rec(xs, ys, debut, fin):
+    """Diviser pour regner sur les indices [debut, fin), retourne (i, j, d2)"""
+
+    #Condition d'arret
+    if fin - debut <= FEUILLE:
+        return _brutforce(xs, ys, debut, fin)
+
+    #Diviser le plan, a egalite on garde la partie droite comme find_rec
+    milieu = (debut + fin) // 2
+    gauche = _find_rec(xs, ys, debut, milieu)
+    droite = _find_rec(xs, ys, milieu, fin)
+    meilleur = gauche if gauche[2] < droite[2] else droite
+    return verifier_bande(xs, ys, debut, fin, xs[milieu], meilleur)
+
+
+def verifier_bande(xs, ys, debut, fin, xmid, meilleur):
+    """
+    Compare meilleur = (i, j, d2) aux paires de la bande de largeur 2 d autour de xmid,
+    parmi les indices [debut, fin). Retourne la meilleure paire (i, j, d2).
+    """
+    #Creation de la bande : les x sont tries donc c'est une tranche
+    d2 = meilleur[2]
+    d = np.sqrt(d2)
+    gauche_bande = debut + int(np.searchsorted(xs[debut:fin], xmid - d, "left"))
+    droite_bande = debut + int(np.searchsorted(xs[debut:fin], xmid + d, "right"))
+    taille = droite_bande - gauche_bande
+    if taille < 2:
+        return meilleur
+    bande = gauche_bande + np.argsort(ys[gauche_bande:droite_bande], kind="stable")
+    bx, by = xs[bande], ys[bande]
+
+    #Distances au carre vers les VOISINS suivants, calculees decalage par decalage
+    carres = np.full((taille, VOISINS), np.inf)
+    for decalage in range(1, min(VOISINS + 1, taille)):
+        dx = bx[decalage:] - bx[:-decalage]
+        dy = by[decalage:] - by[:-decalage]
+        carres[:-decalage, decalage - 1] = dx*dx + dy*dy
+    k = int(np.argmin(carres))
+    ligne, decalage = divmod(k, VOISINS)
+    if carres[ligne, decalage] < d2:
+        return int(bande[ligne]), int(bande[ligne + decalage + 1]), float(carres[ligne, decalage])
+    return meilleur
+
+
+def closest_pair(coordinates):
+    """
+    Retourne les indices (i, j) dans coordinates des deux points les plus proches.
+    Les doublons sont des paires valides (distance nulle).
+    """
+    coords = np.asarray(coordinates, dtype=np.float64)
+    if coords.ndim != 2 or coords.shape[1] != 2:
+        raise ValueError("il faut un tableau de forme (N, 2)")
+    if len(coords) < 2:
+        raise ValueError("il faut au moins deux points")
+    ordre, xs, ys = trier_par_x(coords)
+    i, j, _ = _find_rec(xs, ys, 0, len(coords))
+    return int(ordre[i]), int(ordre[j])
+
+
+def trier_par_x(coords):
+    """Retourne (ordre, xs, ys) avec xs et ys contigus et tries par x"""
+    ordre = np.argsort(coords[:, 0], kind="stable")
+    return ordre, np.ascontiguousarray(coords[ordre, 0]), np.ascontiguousarray(coords[ordre, 1])
+
+
+def points_to_array(points):
+    """Convertit une liste de Point en tableau (N, 2)"""
+    return np.array([point.coordinates for point in points], dtype=np.float64)
+
+
+def print_solution(coordinates):
+    """Meme affichage que main.print_solution"""
+    i, j = closest_pair(coordinates)
+    x_1, y_1 = (float(c) for c in coordinates[i])
+    x_2, y_2 = (float(c) for c in coordinates[j])
+    print(f"{x_1}, {y_1}; {x_2}, {y_2}")
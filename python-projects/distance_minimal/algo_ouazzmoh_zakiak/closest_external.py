@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+
+"""
+Paire la plus proche pour des instances plus grosses que la memoire.
+1. le fichier .pts est lu par blocs, chaque bloc est trie par x
+   et ecrit dans un fichier temporaire binaire (un "run")
+2. les runs sont fusionnes par lots tries par x
+3. un balayage ne garde que la fenetre des points a moins de d_min en x
+   du dernier point lu, plus la meilleure paire
+La memoire utilisee depend du budget et non de la taille du fichier
+(tant que la fenetre de largeur d_min reste petite).
+"""
+
+import os
+from sys import argv
+from tempfile import TemporaryDirectory
+import numpy as np
+
+from closest_array import closest_pair
+from loader import iterer_blocs
+
+
+BUDGET = 64 * 2**20 #Octets de memoire autorises pour les donnees
+OCTETS_PAR_POINT = 64 #Place d'un point pendant le tri d'un run (copies comprises)
+
+
+def ecrire_runs(filename, dossier, budget=BUDGET):
+    """Decoupe l'instance en runs tries par x, retourne leurs chemins"""
+    points_par_run = max(2, budget // OCTETS_PAR_POINT)
+    chemins, blocs, nombre = [], [], 0
+
+    def vider():
+        run = np.concatenate(blocs)
+        run = run[np.argsort(run[:, 0], kind="stable")]
+        chemin = os.path.join(dossier, f"run{len(chemins):05}.f64")
+        run.tofile(chemin)
+        chemins.append(chemin)
+        blocs.clear()
+
+    for bloc in iterer_blocs(filename, max(1024, budget // 8)):
+        blocs.append(bloc)
+        nombre += len(bloc)
+        if nombre >= points_par_run:
+            vider()
+            nombre = 0
+    if blocs:
+        vider()
+    return chemins
+
+
+class Run:
+    """Lecture par blocs d'un run trie"""
+    def __init__(self, chemin, taille_bloc):
+        self.fichier = open(chemin, "rb")
+        self.taille_bloc = taille_bloc
+        self.tampon = np.empty((0, 2))
+        self.fini = False
+        self.remplir()
+
+    def remplir(self):
+        """Lit le bloc suivant si le tampon est vide"""
+        if self.fini or len(self.tampon):
+            return
+        self.tampon = np.fromfile(self.fichier, np.float64, 2 * self.taille_bloc).reshape(-1, 2)
+        if not len(self.tampon):
+            self.fini = True
+            self.fichier.close()
+
+
+def fusionner(chemins, budget=BUDGET):
+    """Genere les points de tous les runs par lots tries par x"""
+    taille_bloc = max(1024, budget // (OCTETS_PAR_POINT * (len(chemins) + 1)))
+    runs = [Run(chemin, taille_bloc) for chemin in chemins]
+    while True:
+        actifs = [run for run in runs if not run.fini]
+        if not actifs:
+            return
+        #Tout ce qui est avant le plus petit dernier x des tampons est definitif
+        borne = min(run.tampon[-1, 0] for run in actifs)
+        morceaux = []
+        for run in actifs:
+            coupure = int(np.searchsorted(run.tampon[:, 0], borne, "right"))
+            morceaux.append(run.tampon[:coupure])
+            run.tampon = run.tampon[coupure:]
+            run.remplir()
+        lot = np.concatenate(morceaux)
+        yield lot[np.argsort(lot[:, 0], kind="stable")]
+
+
+def balayer(lots):
+    """Balayage par x avec une fenetre de largeur d_min, retourne (p, q, d)"""
+    fenetre = np.empty((0, 2))
+    meilleur, d_min = None, np.inf
+    for lot in lots:
+        union = np.concatenate((fenetre, lot))
+        if len(union) >= 2:
+            i, j = closest_pair(union)
+            d = float(np.hypot(*(union[i] - union[j])))
+            if d < d_min:
+                meilleur, d_min = (tuple(union[i].tolist()), tuple(union[j].tolist())), d
+        #Seuls les points a moins de d_min en x du dernier peuvent encore servir
+        fenetre = union[union[:, 0] >= union[-1, 0] - d_min].copy()
+    if meilleur is None:
+        raise ValueError("il faut au moins deux points")
+    return meilleur[0], meilleur[1], d_min
+
+
+def closest_pair_external(filename, budget=BUDGET, dossier=None):
+    """
+    Paire la plus proche d'un fichier .pts sans le charger en memoire.
+    retourne ((x1, y1), (x2, y2), distance).
+    """
+    with TemporaryDirectory(dir=dossier) as temporaire:
+        chemins = ecrire_runs(filename, temporaire, budget)
+        return balayer(fusionner(chemins, budget))
+
+
+def print_solution(filename, budget=BUDGET):
+    """Meme affichage que main.print_solution"""
+    (x_1, y_1), (x_2, y_2), _ = closest_pair_external(filename, budget)
+    print(f"{x_1}, {y_1}; {x_2}, {y_2}")
+
+
+if __name__ == "__main__":
+    for instance in argv[1:]:
+        print_solution(instance)
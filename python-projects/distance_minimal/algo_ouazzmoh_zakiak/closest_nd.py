@@ -0,0 +1,203 @@
+#!/usr/bin/env python3
+
+"""
+Paire la plus proche en dimension quelconque (tableau (N, d), d <= 10 environ).
+find_rec ne marche qu'en 2D (tri sur x, bande sur y, 7 voisins).
+Ici on coupe recursivement a la mediane de la dimension la plus etalee (arbre kd),
+puis on compare les paires de noeuds dont les boites sont a moins de d_min,
+les feuilles etant comparees par blocs numpy.
+L'elagage marche bien quand les points ont peu de dimensions "utiles"
+(amas, variete de petite dimension). Pour des points uniformes en dimension 8
+ou plus les boites se touchent presque toutes : quand le parcours depasse
+BUDGET paires de feuilles par feuille, on passe a une grille de pas d_min
+sur les AXES_GRILLE dimensions les plus etalees (chaque case comparee a ses
+voisines par blocs numpy). Le cout reste superlineaire en grande dimension,
+voir bench_nd.py.
+"""
+
+from itertools import product
+import numpy as np
+
+
+FEUILLE = 64 #Nombre maximal de points dans une feuille
+BUDGET = 8 #Paires de feuilles par feuille avant de passer a la grille
+AXES_GRILLE = 3 #Nombre de dimensions decoupees par la grille
+BLOC = 256 #Lignes par bloc de distances dans la grille
+
+
+class ArbreKd:
+    """Arbre kd stocke a plat, chaque noeud couvre une tranche de self.points"""
+    def __init__(self, coords, feuille=FEUILLE):
+        self.ordre = np.arange(len(coords))
+        self.debut, self.fin, self.gauche, self.droite = [], [], [], []
+        bas, haut = [], []
+        pile = [(0, len(coords), -1, False)]
+        while pile:
+            debut, fin, parent, est_droite = pile.pop()
+            noeud = len(self.debut)
+            if parent >= 0:
+                (self.droite if est_droite else self.gauche)[parent] = noeud
+            bloc = coords[self.ordre[debut:fin]]
+            bas.append(bloc.min(axis=0))
+            haut.append(bloc.max(axis=0))
+            self.debut.append(debut)
+            self.fin.append(fin)
+            self.gauche.append(-1)
+            self.droite.append(-1)
+            if fin - debut > feuille:
+                #Coupe a la mediane de la dimension la plus etalee
+                axe = int(np.argmax(haut[-1] - bas[-1]))
+                milieu = (debut + fin) // 2
+                separation = np.argpartition(bloc[:, axe], milieu - debut)
+                self.ordre[debut:fin] = self.ordre[debut:fin][separation]
+                pile.append((milieu, fin, noeud, True))
+                pile.append((debut, milieu, noeud, False))
+        self.bas, self.haut = np.array(bas), np.array(haut)
+        self.points = np.ascontiguousarray(coords[self.ordre])
+
+    def feuilles(self):
+        """Indices des feuilles"""
+        return [noeud for noeud, gauche in enumerate(self.gauche) if gauche < 0]
+
+    def ecart_carre(self, noeud_1, noeud_2):
+        """Distance au carre minimale entre les boites de deux noeuds"""
+        ecart = np.maximum(0, np.maximum(self.bas[noeud_2] - self.haut[noeud_1],
+                                         self.bas[noeud_1] - self.haut[noeud_2]))
+        return float(ecart @ ecart)
+
+    def proches(self, noeud, autre, carre_max):
+        """Indices des points de noeud a distance au carre < carre_max de la boite d'autre"""
+        debut = self.debut[noeud]
+        bloc = self.points[debut:self.fin[noeud]]
+        ecart = np.maximum(0, np.maximum(self.bas[autre] - bloc, bloc - self.haut[autre]))
+        return debut + np.flatnonzero((ecart * ecart).sum(axis=1) < carre_max)
+
+
+def _meilleure(carres):
+    """(ligne, colonne, valeur) du minimum d'une matrice de distances au carre"""
+    ligne, colonne = divmod(int(np.argmin(carres)), carres.shape[1])
+    return ligne, colonne, float(carres[ligne, colonne])
+
+
+def _meilleure_entre(points, lignes, colonnes, meilleur, triangle=False):
+    """Compare meilleur = (i, j, d2) aux paires (lignes x colonnes) par blocs,
+    triangle : lignes == colonnes, on ne garde que les paires i < j"""
+    for debut in range(0, len(lignes), BLOC):
+        bloc = lignes[debut:debut + BLOC]
+        autres = colonnes[debut + 1:] if triangle else colonnes
+        if len(autres) == 0:
+            continue
+        ecarts = points[bloc][:, None, :] - points[autres][None, :, :]
+        carres = np.einsum("ijk,ijk->ij", ecarts, ecarts)
+        if triangle:
+            carres[np.tri(*carres.shape, k=-1, dtype=bool)] = np.inf
+        ligne, colonne, valeur = _meilleure(carres)
+        if valeur < meilleur[2]:
+            meilleur = (int(bloc[ligne]), int(autres[colonne]), valeur)
+    return meilleur
+
+
+def _grille(points, meilleur):
+    """
+    Paire la plus proche par une grille de pas d = sqrt(meilleur[2])
+    sur les AXES_GRILLE dimensions les plus etalees : une paire a moins de d
+    est dans la meme case ou dans deux cases voisines.
+    """
+    cote = np.sqrt(meilleur[2])
+    if cote == 0:
+        return meilleur
+    etendue = points.max(axis=0) - points.min(axis=0)
+    axes = np.argsort(etendue)[::-1][:AXES_GRILLE]
+    #La derniere case de chaque axe absorbe le reste, elle fait au moins cote
+    tailles = np.maximum(1, (etendue[axes] // cote).astype(np.int64))
+    cases = np.minimum(((points[:, axes] - points[:, axes].min(axis=0)) // cote).astype(np.int64),
+                       tailles - 1)
+    cles = np.ravel_multi_index(cases.T, tailles)
+    ordre = np.argsort(cles, kind="stable")
+    cles_triees = cles[ordre]
+    presentes, debuts = np.unique(cles_triees, return_index=True)
+    fins = np.append(debuts[1:], len(ordre))
+    contenu = dict(zip(presentes.tolist(), zip(debuts.tolist(), fins.tolist())))
+    #Voisines "en avant" : chaque paire de cases n'est vue qu'une fois
+    decalages = [decalage for decalage in product((-1, 0, 1), repeat=len(axes))
+                 if decalage > (0,)*len(axes)]
+    for cle, (debut, fin) in contenu.items():
+        case = np.unravel_index(cle, tailles)
+        lignes = ordre[debut:fin]
+        meilleur = _meilleure_entre(points, lignes, lignes, meilleur, triangle=True)
+        voisines = []
+        for decalage in decalages:
+            voisine = [c + dc for c, dc in zip(case, decalage)]
+            if all(0 <= c < t for c, t in zip(voisine, tailles)):
+                bornes = contenu.get(int(np.ravel_multi_index(voisine, tailles)))
+                if bornes is not None:
+                    voisines.append(ordre[bornes[0]:bornes[1]])
+        if voisines:
+            meilleur = _meilleure_entre(points, lignes, np.concatenate(voisines), meilleur)
+    return meilleur
+
+
+def closest_pair_nd(coordinates):
+    """
+    Retourne (i, j, distance) pour les deux points les plus proches
+    d'un tableau (N, d). Les doublons sont des paires valides.
+    """
+    coords = np.asarray(coordinates, dtype=np.float64)
+    if coords.ndim != 2 or len(coords) < 2:
+        raise ValueError("il faut un tableau (N, d) d'au moins deux points")
+    arbre = ArbreKd(coords)
+    points = arbre.points
+    meilleur = (0, 1, float(((points[0] - points[1])**2).sum()))
+
+    #1. paires internes aux feuilles : donne vite un bon d_min
+    for feuille in arbre.feuilles():
+        debut, fin = arbre.debut[feuille], arbre.fin[feuille]
+        bloc = points[debut:fin]
+        carres = ((bloc[:, None, :] - bloc[None, :, :])**2).sum(axis=2)
+        carres[np.tri(fin - debut, dtype=bool)] = np.inf
+        ligne, colonne, valeur = _meilleure(carres)
+        if valeur < meilleur[2]:
+            meilleur = (debut + ligne, debut + colonne, valeur)
+
+    #2. paires de noeuds freres, elaguees par la distance entre boites
+    pile = [(arbre.gauche[noeud], arbre.droite[noeud])
+            for noeud in range(len(arbre.debut)) if arbre.gauche[noeud] >= 0]
+    budget = BUDGET * len(arbre.feuilles())
+    while pile:
+        if budget < 0:
+            #L'elagage ne marche plus : grille sur tous les points
+            meilleur = _grille(points, meilleur)
+            break
+        noeud_1, noeud_2 = pile.pop()
+        if arbre.ecart_carre(noeud_1, noeud_2) >= meilleur[2]:
+            continue
+        feuille_1, feuille_2 = arbre.gauche[noeud_1] < 0, arbre.gauche[noeud_2] < 0
+        if feuille_1 and feuille_2:
+            #On ne garde que les points a moins de d_min de la boite d'en face
+            budget -= 1
+            indices_1 = arbre.proches(noeud_1, noeud_2, meilleur[2])
+            indices_2 = arbre.proches(noeud_2, noeud_1, meilleur[2])
+            if len(indices_1) == 0 or len(indices_2) == 0:
+                continue
+            carres = ((points[indices_1][:, None, :] - points[indices_2][None, :, :])**2).sum(axis=2)
+            ligne, colonne, valeur = _meilleure(carres)
+            if valeur < meilleur[2]:
+                meilleur = (int(indices_1[ligne]), int(indices_2[colonne]), valeur)
+        elif feuille_2 or (not feuille_1 and
+                           arbre.fin[noeud_1] - arbre.debut[noeud_1]
+                           >= arbre.fin[noeud_2] - arbre.debut[noeud_2]):
+            #On descend dans le plus gros des deux noeuds
+            pile.append((arbre.gauche[noeud_1], noeud_2))
+            pile.append((arbre.droite[noeud_1], noeud_2))
+        else:
+            pile.append((noeud_1, arbre.gauche[noeud_2]))
+            pile.append((noeud_1, arbre.droite[noeud_2]))
+
+    i, j, carre = meilleur
+    return int(arbre.ordre[i]), int(arbre.ordre[j]), float(np.sqrt(carre))
+
+
+def recherche_nd(points):
+    """Meme interface que find_rec pour des Point de dimension quelconque"""
+    i, j, _ = closest_pair_nd(np.array([point.coordinates for point in points]))
+    return [points[i], points[j]]
@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+
+"""
+Paire la plus proche sur plusieurs coeurs.
+Les points tries par x sont places une seule fois en memoire partagee,
+chaque processus resout une tranche verticale avec closest_array,
+puis on recolle les tranches voisines avec une bande de largeur 2 d_min.
+"""
+
+import os
+from multiprocessing import Pool
+from multiprocessing.shared_memory import SharedMemory
+import numpy as np
+
+from closest_array import closest_pair, points_to_array, trier_par_x, verifier_bande, _find_rec
+
+
+SEUIL = 200000 #En dessous on reste sur un seul coeur
+
+_PARTAGE = {} #Memoire partagee vue depuis chaque processus du pool
+
+
+def _attacher(nom, taille):
+    """Initialisation d'un processus : vue (xs, ys) sur la memoire partagee"""
+    memoire = SharedMemory(name=nom)
+    tableau = np.ndarray((2, taille), dtype=np.float64, buffer=memoire.buf)
+    _PARTAGE["memoire"] = memoire #Garder le bloc ouvert tant que le processus vit
+    _PARTAGE["xs"], _PARTAGE["ys"] = tableau[0], tableau[1]
+
+
+def _resoudre_tranche(tranche):
+    """Diviser pour regner sur la tranche [debut, fin), retourne (i, j, d2)"""
+    debut, fin = tranche
+    return _find_rec(_PARTAGE["xs"], _PARTAGE["ys"], debut, fin)
+
+
+def tranches(taille, nombre):
+    """Decoupe [0, taille) en nombre intervalles consecutifs de tailles proches"""
+    bornes = np.linspace(0, taille, nombre + 1).astype(int)
+    return [(int(debut), int(fin)) for debut, fin in zip(bornes[:-1], bornes[1:])]
+
+
+def closest_pair_parallel(coordinates, processus=None):
+    """
+    Retourne les indices (i, j) des deux points les plus proches,
+    en repartissant le travail sur processus coeurs (tous par defaut).
+    """
+    coords = np.asarray(coordinates, dtype=np.float64)
+    processus = processus or os.cpu_count()
+    if len(coords) < max(SEUIL, 2 * processus) or processus == 1:
+        return closest_pair(coords)
+
+    ordre, xs, ys = trier_par_x(coords)
+    taille = len(coords)
+    memoire = SharedMemory(create=True, size=2 * taille * 8)
+    try:
+        partage = np.ndarray((2, taille), dtype=np.float64, buffer=memoire.buf)
+        partage[0], partage[1] = xs, ys
+        del partage
+        decoupage = tranches(taille, processus)
+        with Pool(processus, initializer=_attacher, initargs=(memoire.name, taille)) as pool:
+            resultats = pool.map(_resoudre_tranche, decoupage)
+    finally:
+        memoire.close()
+        memoire.unlink()
+
+    #Recollement deux a deux des tranches voisines, comme les niveaux de find_rec :
+    #chaque moitie n'a aucune paire a moins de d, les VOISINS suivants suffisent
+    #dans la bande (ce n'est plus vrai pour une bande couvrant plusieurs tranches)
+    niveau = [(debut, fin, resultat) for (debut, fin), resultat in zip(decoupage, resultats)]
+    while len(niveau) > 1:
+        suivant = []
+        for k in range(0, len(niveau) - 1, 2):
+            (debut, frontiere, gauche), (_, fin, droite) = niveau[k], niveau[k + 1]
+            meilleur = min(gauche, droite, key=lambda resultat: resultat[2])
+            meilleur = verifier_bande(xs, ys, debut, fin, xs[frontiere], meilleur)
+            suivant.append((debut, fin, meilleur))
+        if len(niveau) % 2:
+            suivant.append(niveau[-1])
+        niveau = suivant
+    i, j, _ = niveau[0][2]
+    return int(ordre[i]), int(ordre[j])
+
+
+def recherche_parallele(points):
+    """Version multi-coeurs pour main.ALGORITHMES, retourne deux Point"""
+    i, j = closest_pair_parallel(points_to_array(points))
+    return [points[i], points[j]]
@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+
+"""
+Paire la plus proche par insertion aleatoire dans une grille (Rabin, Khuller-Matias).
+On insere les points dans un ordre aleatoire dans une grille de pas d_min :
+un voisin a moins de d_min est forcement dans les 9 cases autour.
+Quand d_min diminue on reconstruit la grille, ce qui arrive rarement
+(probabilite 2/i a la i-eme insertion) : temps moyen en O(n).
+"""
+
+from math import floor, hypot
+import random
+
+
+def _grille(coords, nombre, pas):
+    """Grille {(i, j): [indices]} des nombre premiers points"""
+    grille = {}
+    for k in range(nombre):
+        x, y = coords[k]
+        grille.setdefault((floor(x/pas), floor(y/pas)), []).append(k)
+    return grille
+
+
+def recherche_aleatoire(points, generateur=random):
+    """Insertion aleatoire, retourne les deux points les plus proches"""
+    if len(points) < 2:
+        raise ValueError("il faut au moins deux points")
+    ordre = list(range(len(points)))
+    generateur.shuffle(ordre)
+    coords = [points[i].coordinates for i in ordre]
+
+    paire = (0, 1)
+    d_min = hypot(coords[0][0] - coords[1][0], coords[0][1] - coords[1][1])
+    grille = _grille(coords, 2, d_min) if d_min > 0 else None
+
+    for k in range(2, len(coords)):
+        if d_min == 0: #Doublon, on ne peut pas faire mieux
+            break
+        x, y = coords[k]
+        i, j = floor(x/d_min), floor(y/d_min)
+        meilleur = None
+        for case in ((i+a, j+b) for a in (-1, 0, 1) for b in (-1, 0, 1)):
+            for autre in grille.get(case, ()):
+                d = hypot(x - coords[autre][0], y - coords[autre][1])
+                if d < d_min:
+                    d_min, meilleur = d, autre
+        if meilleur is None:
+            grille.setdefault((i, j), []).append(k)
+        else:
+            paire = (meilleur, k)
+            if d_min > 0:
+                grille = _grille(coords, k + 1, d_min)
+
+    #Meme ordre que find_rec apres le tri par x de print_solution
+    premier, second = sorted((ordre[paire[0]], ordre[paire[1]]),
+                             key=lambda indice: (points[indice].coordinates[0], indice))
+    return [points[premier], points[second]]
@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+
+"""
+Generateurs de nuages de points de test, sous forme de tableaux (N, 2).
+Tous les generateurs sont deterministes pour une graine donnee.
+"""
+
+from math import ceil, sqrt
+import numpy as np
+
+
+def uniforme(taille, graine=0):
+    """Points uniformes dans le carre unite"""
+    return np.random.default_rng(graine).uniform(0, 1, (taille, 2))
+
+
+def amas(taille, graine=0):
+    """Amas gaussiens serres autour de centres uniformes (environ 1000 points par amas)"""
+    generateur = np.random.default_rng(graine)
+    centres = generateur.uniform(0, 1, (max(1, taille // 1000), 2))
+    choix = generateur.integers(0, len(centres), taille)
+    return centres[choix] + generateur.normal(0, 0.01, (taille, 2))
+
+
+def alignes(taille, graine=0):
+    """Points sur la droite y = 2x + 1"""
+    x = np.random.default_rng(graine).uniform(0, 1, taille)
+    return np.column_stack((x, 2*x + 1))
+
+
+def doublons(taille, graine=0):
+    """Environ 10 copies de chaque point"""
+    generateur = np.random.default_rng(graine)
+    distincts = generateur.uniform(0, 1, (max(2, taille // 10), 2))
+    return distincts[generateur.integers(0, len(distincts), taille)]
+
+
+def grille(taille, graine=0):
+    """Points a coordonnees entieres sur une grille carree, dans le desordre"""
+    cote = ceil(sqrt(taille))
+    indices = np.random.default_rng(graine).permutation(cote * cote)[:taille]
+    return np.column_stack((indices % cote, indices // cote)).astype(np.float64)
+
+
+DISTRIBUTIONS = {
+    "uniforme" : uniforme,
+    "amas" : amas,
+    "alignes" : alignes,
+    "doublons" : doublons,
+    "grille" : grille,
+}
+
+
+def ecrire_pts(chemin, coords):
+    """Ecrit un nuage au format .pts "x, y" """
+    np.savetxt(chemin, coords, fmt="%.17g", delimiter=", ")
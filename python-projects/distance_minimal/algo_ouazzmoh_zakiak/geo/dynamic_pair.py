@@ -0,0 +1,181 @@
+"""
+closest pair of a set of 2d points under insertions and deletions.
+"""
+from heapq import heapify, heappop, heappush
+from math import floor, hypot, inf, sqrt
+from geo.quadrant import Quadrant
+
+
+class DynamicClosestPair:
+    """
+    points are stored in a grid of square cells.
+    each point knows its nearest neighbour among the 9 cells around it
+    and a heap holds all (distance, point, neighbour) candidates.
+
+    for example:
+
+    - build the structure and add a point:
+
+    pairs = DynamicClosestPair(points)
+    key = pairs.insert(Point([2, 5]))
+
+    - remove it and get the current closest pair:
+
+    pairs.remove(key)
+    point1, point2, distance = pairs.closest_pair()
+
+    insertions and deletions look only at the 9 cells around a point
+    (and at the few points having it as nearest neighbour),
+    so they cost O(log n) for uniformly spread points.
+    if the closest pair gets farther than the cell size, the grid is rebuilt
+    with bigger cells.
+    """
+    def __init__(self, points=(), cell_size=None):
+        """
+        build structure on an iterable of points.
+        keys of initial points are 0, 1, 2, ...
+        """
+        points = list(points)
+        if cell_size is None:
+            cell_size = default_cell_size(points)
+        self.cell_size = cell_size
+        self.points = {}
+        self.coordinates = {}
+        self.cells = {}
+        self.nearest = {}  # key -> (distance, key of nearest neighbour)
+        self.nearest_of = {}  # key -> keys having it as nearest neighbour
+        self.heap = []
+        self.next_key = 0
+        for point in points:
+            self.insert(point)
+
+    def cell(self, coordinates):
+        """
+        return (column, row) of the cell containing given coordinates.
+        """
+        return (floor(coordinates[0] / self.cell_size), floor(coordinates[1] / self.cell_size))
+
+    def _neighbours(self, key):
+        """
+        iterate on (distance, other key) for all points in the 9 cells around key.
+        """
+        x, y = self.coordinates[key]
+        column, row = self.cell((x, y))
+        for i in (column - 1, column, column + 1):
+            for j in (row - 1, row, row + 1):
+                for other in self.cells.get((i, j), ()):
+                    if other != key:
+                        x_2, y_2 = self.coordinates[other]
+                        yield hypot(x - x_2, y - y_2), other
+
+    def _set_nearest(self, key, distance, other):
+        """
+        register other as nearest neighbour of key.
+        """
+        old = self.nearest.get(key)
+        if old is not None and old[1] in self.nearest_of:
+            self.nearest_of[old[1]].discard(key)
+        self.nearest[key] = (distance, other)
+        if other is not None:
+            self.nearest_of[other].add(key)
+            heappush(self.heap, (distance, key, other))
+
+    def _update_nearest(self, key):
+        """
+        recompute nearest neighbour of key.
+        """
+        self._set_nearest(key, *min(self._neighbours(key), default=(inf, None)))
+
+    def insert(self, point):
+        """
+        add a point, return its key.
+        """
+        key = self.next_key
+        self.next_key += 1
+        self.points[key] = point
+        self.coordinates[key] = tuple(point.coordinates)
+        self.cells.setdefault(self.cell(self.coordinates[key]), set()).add(key)
+        self.nearest_of[key] = set()
+        best = (inf, None)
+        for distance, other in self._neighbours(key):
+            best = min(best, (distance, other))
+            if distance < self.nearest[other][0]:
+                self._set_nearest(other, distance, key)
+        self._set_nearest(key, *best)
+        self._compact()
+        return key
+
+    def remove(self, key):
+        """
+        remove point of given key, return it.
+        """
+        cell = self.cell(self.coordinates[key])
+        self.cells[cell].discard(key)
+        if not self.cells[cell]:
+            del self.cells[cell]
+        self._set_nearest(key, inf, None)
+        del self.nearest[key]
+        del self.coordinates[key]
+        for other in self.nearest_of.pop(key):
+            self._update_nearest(other)
+        self._compact()
+        return self.points.pop(key)
+
+    def _compact(self):
+        """
+        drop outdated heap entries once they outnumber valid ones.
+        """
+        if len(self.heap) > 4 * len(self.nearest) + 64:
+            self.heap = [(d, key, other) for key, (d, other) in self.nearest.items()
+                         if other is not None]
+            heapify(self.heap)
+
+    def _rebuild(self, cell_size):
+        """
+        put all points in a new grid of given cell size.
+        """
+        self.cell_size = cell_size
+        self.cells = {}
+        for key, coordinates in self.coordinates.items():
+            self.cells.setdefault(self.cell(coordinates), set()).add(key)
+        self.nearest = {key: (inf, None) for key in self.coordinates}
+        self.nearest_of = {key: set() for key in self.coordinates}
+        self.heap = []
+        for key in self.coordinates:
+            self._update_nearest(key)
+
+    def closest_pair(self):
+        """
+        return (point1, point2, distance) for current closest pair.
+        return None if there are less than two points.
+        """
+        if len(self.points) < 2:
+            return None
+        while True:
+            while self.heap:
+                distance, key, other = self.heap[0]
+                if self.nearest.get(key) == (distance, other):
+                    break
+                heappop(self.heap)
+            # a pair farther than the cell size may hide a closer one
+            if self.heap and self.heap[0][0] <= self.cell_size:
+                return self.points[key], self.points[other], distance
+            self._rebuild(2 * self.cell_size)
+
+    def __len__(self):
+        return len(self.points)
+
+
+def default_cell_size(points):
+    """
+    side of a square of area bounding box area / number of points.
+    """
+    if len(points) < 2:
+        return 1.0
+    quadrant = Quadrant.empty_quadrant(2)
+    for point in points:
+        quadrant.add_point(point)
+    width, height = (b - a for a, b in zip(*quadrant.get_arrays()))
+    if width * height > 0:
+        return sqrt(width * height / len(points))
+    return max(width, height) / len(points) or 1.0
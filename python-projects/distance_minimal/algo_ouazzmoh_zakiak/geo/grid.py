@@ -0,0 +1,168 @@
+"""
+uniform grid index on 2d points, for repeated proximity queries.
+"""
+from collections import defaultdict
+from heapq import heappush, heappushpop
+from math import floor, ceil, sqrt
+from geo.point import BasePoint, Point
+from geo.quadrant import Quadrant
+
+
+class GridIndex:
+    """
+    points bucketed in square cells of equal size.
+
+    for example:
+
+    - build an index:
+
+    index = GridIndex(points)
+
+    - find the 3 points nearest to a point:
+
+    neighbours = index.nearest(Point([2, 5]), 3)
+
+    - find all pairs of points at distance less than 0.1:
+
+    pairs = index.pairs_within(0.1)
+
+    by default cells are sized to hold about one point each
+    (for uniformly spread points).
+    """
+    def __init__(self, points, cell_size=None):
+        """
+        build index on an iterable of points or of (x, y) coordinates.
+        """
+        self.points = [p if isinstance(p, BasePoint) else Point(tuple(p)) for p in points]
+        self.coordinates = [tuple(p.coordinates) for p in self.points]
+        self.quadrant = Quadrant.empty_quadrant(2)
+        for point in self.points:
+            self.quadrant.add_point(point)
+
+        if cell_size is None:
+            cell_size = self._default_cell_size()
+        self.cell_size = cell_size
+
+        self.cells = defaultdict(list)
+        for index, coordinates in enumerate(self.coordinates):
+            self.cells[self.cell(coordinates)].append(index)
+        if self.points:
+            self.max_cell = self.cell(self.quadrant.max_coordinates)
+        else:
+            self.max_cell = (0, 0)
+
+    def _default_cell_size(self):
+        """
+        side of a square of area bounding box area / number of points.
+        """
+        if not self.points:
+            return 1.0
+        width = self.quadrant.max_coordinates[0] - self.quadrant.min_coordinates[0]
+        height = self.quadrant.max_coordinates[1] - self.quadrant.min_coordinates[1]
+        if width * height > 0:
+            return sqrt(width * height / len(self.points))
+        if max(width, height) > 0:  # all points are aligned
+            return max(width, height) / len(self.points)
+        return 1.0
+
+    def cell(self, coordinates):
+        """
+        return (column, row) of the cell containing given coordinates.
+        """
+        return (floor((coordinates[0] - self.quadrant.min_coordinates[0]) / self.cell_size),
+                floor((coordinates[1] - self.quadrant.min_coordinates[1]) / self.cell_size))
+
+    def _ring(self, center, radius):
+        """
+        iterate on non empty cells at chebyshev distance radius of center.
+        """
+        column, row = center
+        if radius == 0:
+            cells = [center]
+        else:
+            cells = [(column + i, row + j)
+                     for i in range(-radius, radius + 1) for j in (-radius, radius)]
+            cells.extend((column + i, row + j)
+                         for i in (-radius, radius) for j in range(-radius + 1, radius))
+        for cell in cells:
+            if cell in self.cells:
+                yield self.cells[cell]
+
+    def nearest(self, point, count=1):
+        """
+        return the count points nearest to given point, closest first.
+        """
+        x, y = point.coordinates
+        center = self.cell((x, y))
+        # past this ring, every cell of the grid has been visited
+        last_ring = max(abs(center[0]), abs(center[1]),
+                        abs(center[0] - self.max_cell[0]), abs(center[1] - self.max_cell[1]))
+        best = []  # heap of (-squared distance, index)
+        for radius in range(last_ring + 1):
+            for indices in self._ring(center, radius):
+                for index in indices:
+                    x_2, y_2 = self.coordinates[index]
+                    candidate = (-((x - x_2) ** 2 + (y - y_2) ** 2), index)
+                    if len(best) < count:
+                        heappush(best, candidate)
+                    elif candidate > best[0]:
+                        heappushpop(best, candidate)
+            # points in further rings are at least radius * cell_size away
+            if len(best) == count and -best[0][0] <= (radius * self.cell_size) ** 2:
+                break
+        return [self.points[index] for _, index in sorted(best, reverse=True)]
+
+    def within(self, point, radius):
+        """
+        return all points at distance at most radius of given point.
+        """
+        x, y = point.coordinates
+        min_column, min_row = self.cell((x - radius, y - radius))
+        max_column, max_row = self.cell((x + radius, y + radius))
+        squared_radius = radius * radius
+        found = []
+        for column in range(max(min_column, 0), min(max_column, self.max_cell[0]) + 1):
+            for row in range(max(min_row, 0), min(max_row, self.max_cell[1]) + 1):
+                for index in self.cells.get((column, row), ()):
+                    x_2, y_2 = self.coordinates[index]
+                    if (x - x_2) ** 2 + (y - y_2) ** 2 <= squared_radius:
+                        found.append(self.points[index])
+        return found
+
+    def pairs_within(self, distance):
+        """
+        return all pairs of points at distance strictly less than given one.
+        """
+        span = max(1, ceil(distance / self.cell_size))
+        # half of the neighbourhood, so that each pair of cells is seen once
+        offsets = [(i, j) for i in range(0, span + 1) for j in range(-span, span + 1)
+                   if i > 0 or j > 0]
+        squared_distance = distance * distance
+        pairs = []
+        for (column, row), indices in self.cells.items():
+            for position, index in enumerate(indices):
+                x, y = self.coordinates[index]
+                for other in indices[position + 1:]:
+                    x_2, y_2 = self.coordinates[other]
+                    if (x - x_2) ** 2 + (y - y_2) ** 2 < squared_distance:
+                        pairs.append((self.points[index], self.points[other]))
+            for i, j in offsets:
+                others = self.cells.get((column + i, row + j))
+                if others is None:
+                    continue
+                for index in indices:
+                    x, y = self.coordinates[index]
+                    for other in others:
+                        x_2, y_2 = self.coordinates[other]
+                        if (x - x_2) ** 2 + (y - y_2) ** 2 < squared_distance:
+                            pairs.append((self.points[index], self.points[other]))
+        return pairs
+
+    def bounding_quadrant(self):
+        """
+        return min quadrant containing all indexed points.
+        """
+        return self.quadrant.copy()
+
+    def __len__(self):
+        return len(self.points)
@@ -5,25 +5,14 @@ from math import sqrt
 from geo.quadrant import Quadrant
 
 
-class Point:
+class BasePoint:
     """
-    a point is defined as a vector of any given dimension.
-
-    for example:
-
-    - create a point at x=2, y=5:
+    methods shared by all points, reading only self.coordinates.
 
-    my_point = Point([2, 5])
-
-    - find distance between two points:
-
-    distance = point1.distance_to(point2)
+    nothing is stored here (empty __slots__): subclasses decide where
+    the coordinates live, see Point and geo.point_array.PointView.
     """
-    def __init__(self, coordinates):
-        """
-        build new point using an array of coordinates.
-        """
-        self.coordinates = coordinates
+    __slots__ = ()
 
     def copy(self):
         """
@@ -102,5 +91,32 @@ class Point:
     def __lt__(self, other):
         """
         lexicographical comparison
+        (coordinates may be stored as a list or a tuple, see geo.point_array)
         """
-        return self.coordinates < other.coordinates
+        return tuple(self.coordinates) < tuple(other.coordinates)
+
+
+class Point(BasePoint):
+    """
+    a point is defined as a vector of any given dimension.
+
+    for example:
+
+    - create a point at x=2, y=5:
+
+    my_point = Point([2, 5])
+
+    - find distance between two points:
+
+    distance = point1.distance_to(point2)
+
+    points have no __dict__, only their coordinates are stored.
+    see geo.point_array for storing many points in a single buffer.
+    """
+    __slots__ = ("coordinates",)
+
+    def __init__(self, coordinates):
+        """
+        build new point using an array of coordinates.
+        """
+        self.coordinates = coordinates
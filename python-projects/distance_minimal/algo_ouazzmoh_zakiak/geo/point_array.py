@@ -0,0 +1,131 @@
+"""
+many points (any dimension) stored in one contiguous buffer of doubles.
+"""
+from array import array
+from geo.point import BasePoint, Point
+from geo.quadrant import Quadrant
+
+
+class PointView(BasePoint):
+    """
+    lightweight point reading its coordinates inside a PointArray.
+
+    views are created on demand by the array and share its buffer.
+    they behave like read-only points: arithmetic returns new Points.
+    """
+    __slots__ = ("buffer", "offset", "dimension")
+
+    def __init__(self, buffer, offset, dimension):
+        self.buffer = buffer
+        self.offset = offset
+        self.dimension = dimension
+
+    @property
+    def coordinates(self):
+        """
+        tuple of coordinates, read from the shared buffer.
+        """
+        return tuple(self.buffer[self.offset:self.offset + self.dimension])
+
+
+class PointArray:
+    """
+    array of points of a given dimension.
+
+    for example:
+
+    - build from existing points:
+
+    points = PointArray.from_points([Point([2, 5]), Point([1, 3])])
+
+    - get a point (a PointView on the buffer):
+
+    distance = points[0].distance_to(points[1])
+
+    a point array can be given directly to tycat.
+    """
+    def __init__(self, coordinates=(), dimension=2):
+        """
+        build new array from a flat iterable of coordinates.
+        """
+        self.dimension = dimension
+        self.buffer = array('d', coordinates)
+        assert len(self.buffer) % dimension == 0, 'incomplete point'
+
+    @classmethod
+    def from_points(cls, points, dimension=2):
+        """
+        build new array holding a copy of all given points.
+        """
+        point_array = cls(dimension=dimension)
+        for point in points:
+            point_array.append(point)
+        return point_array
+
+    def append(self, point):
+        """
+        add a copy of given point at the end of the array.
+        """
+        assert len(point.coordinates) == self.dimension, 'wrong dimension'
+        self.buffer.extend(point.coordinates)
+
+    def copy(self):
+        """
+        return copy of given array (the buffer is copied).
+        """
+        return PointArray(self.buffer, self.dimension)
+
+    def sort(self, key=None, reverse=False):
+        """
+        sort points in place, like list.sort (lexicographically by default).
+        key is called on Points holding a copy of the coordinates.
+        the buffer is rewritten in place: an existing view now reads
+        the point sorted at its index.
+        """
+        points = [Point(tuple(self.buffer[offset:offset + self.dimension]))
+                  for offset in range(0, len(self.buffer), self.dimension)]
+        points.sort(key=key, reverse=reverse)
+        self.buffer[:] = array('d', (c for point in points for c in point.coordinates))
+
+    def bounding_quadrant(self):
+        """
+        return min quadrant containing all points.
+        """
+        if not self.buffer:
+            return Quadrant.empty_quadrant(self.dimension)
+        columns = [self.buffer[i::self.dimension] for i in range(self.dimension)]
+        return Quadrant([min(c) for c in columns], [max(c) for c in columns])
+
+    def svg_content(self):
+        """
+        svg display for tycat (all points at once).
+        """
+        return ''.join(point.svg_content() for point in self)
+
+    def __len__(self):
+        return len(self.buffer) // self.dimension
+
+    def __getitem__(self, index):
+        """
+        return a view on the point at given index,
+        or a new array (copy) for a slice, like a list of points.
+        """
+        if isinstance(index, slice):
+            start, stop, step = index.indices(len(self))
+            sliced = PointArray(dimension=self.dimension)
+            for position in range(start, stop, step):
+                offset = position * self.dimension
+                sliced.buffer.extend(self.buffer[offset:offset + self.dimension])
+            return sliced
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError('point index out of range')
+        return PointView(self.buffer, index * self.dimension, self.dimension)
+
+    def __iter__(self):
+        for offset in range(0, len(self.buffer), self.dimension):
+            yield PointView(self.buffer, offset, self.dimension)
+
+    def __repr__(self):
+        return "PointArray.from_points([" + ', '.join(repr(p) for p in self) + "])"
@@ -59,6 +59,17 @@ class Displayer:
         svg_file.write('<g stroke-width="{}" opacity="0.7">\n'.format(self.stroke_size))
         return svg_file
 
+    def one_point_per_pixel(self, array):
+        """
+        keep only the first point of given (n, 2) array falling in each pixel.
+        """
+        import numpy as np  # pylint: disable=import-outside-toplevel
+        scale = min(a/b for a, b in zip(self.svg_dimensions, self.dimensions))
+        pixels = np.floor((array - self.min_coordinates) * scale).astype(np.int64)
+        keys = pixels[:, 0] * (self.svg_dimensions[1] + 1) + pixels[:, 1]
+        _, first_indices = np.unique(keys, return_index=True)
+        return array[np.sort(first_indices)]
+
     def close_svg(self, svg_file):
         """
         close svg file
@@ -68,16 +79,9 @@ class Displayer:
         svg_file.write("</svg>\n")
         svg_file.close()
 
-def tycat(*things):
+def next_filename():
     """
-    graphically displays all objects given.
-    each argument will be displayed in a different color.
-    requires :
-        - the terminology terminal emulator
-        - each object either implements
-            * bounding_quadrant
-            * svg_content
-        or is an iterable on things implementing it.
+    return name of next svg file to display (and print its number).
     """
     print("[", Displayer.file_count, "]")
 
@@ -89,7 +93,21 @@ def tycat(*things):
 
     filename = "{}/{}.svg".format(directory, str(Displayer.file_count).zfill(5))
     Displayer.file_count += 1
+    return filename
+
 
+def tycat(*things):
+    """
+    graphically displays all objects given.
+    each argument will be displayed in a different color.
+    requires :
+        - the terminology terminal emulator
+        - each object either implements
+            * bounding_quadrant
+            * svg_content
+        or is an iterable on things implementing it.
+    """
+    filename = next_filename()
     size, svg_strings = compute_displays(things)
     try:
         display = Displayer(size)
@@ -138,3 +156,48 @@ def compute_display(thing):
         quadrant.update(thing.bounding_quadrant())
 
     return quadrant, strings
+
+
+def tycat_arrays(*arrays, decimate=False):
+    """
+    graphically displays big clouds of points, faster than tycat.
+    each argument is an array of shape (n, 2) (numpy array, for example
+    the ones returned by loader.load_coordinates) displayed in a different color.
+    bounding box comes from array min/max and svg is written by chunks,
+    without building one string per point.
+    if decimate is true, only one point per displayed pixel is kept:
+    file size is then bounded by the svg resolution.
+    """
+    filename = next_filename()
+    arrays = [a for a in arrays if len(a)]
+    if not arrays:
+        print("displaying image {} failed : it is empty".format(Displayer.file_count-1))
+        return
+    quadrant = Quadrant.empty_quadrant(2)
+    for array in arrays:
+        quadrant.update(Quadrant(array.min(axis=0).tolist(), array.max(axis=0).tolist()))
+    try:
+        display = Displayer(quadrant)
+    except ValueError:
+        print("displaying image {} failed : it is flat".format(Displayer.file_count-1))
+        return
+
+    svg_file = display.open_svg(filename)
+    for color, array in zip(cycle(iter(Displayer.svg_colors)), arrays):
+        if decimate:
+            array = display.one_point_per_pixel(array)
+        svg_file.write('<g fill="{}" stroke="{}">\n'.format(color, color))
+        write_points(svg_file, array)
+        svg_file.write('</g>\n')
+    display.close_svg(svg_file)
+    os.system("tycat {}".format(filename))
+
+
+def write_points(svg_file, array, chunk_size=65536):
+    """
+    write svg of all points of given (n, 2) array, chunk by chunk.
+    """
+    for start in range(0, len(array), chunk_size):
+        chunk = array[start:start+chunk_size]
+        svg_file.write(
+            ('<use xlink:href="#c" x="%r" y="%r"/>\n' * len(chunk)) % tuple(chunk.ravel().tolist()))
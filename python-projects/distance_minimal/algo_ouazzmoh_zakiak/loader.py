@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+
+"""
+Chargement rapide des fichiers .pts ("x, y" par ligne) dans un tableau (N, 2).
+Le texte est lu par gros blocs et converti directement en float64,
+puis ecrit dans un cache binaire a cote du fichier (exemple.pts.f64).
+Les chargements suivants se contentent de projeter ce cache en memoire.
+Si le dossier n'est pas accessible en ecriture on charge sans cache.
+"""
+
+import os
+import numpy as np
+
+
+TAILLE_BLOC = 1 << 26 #Nombre d'octets lus a chaque fois (64 Mo)
+SUFFIXE_CACHE = ".f64"
+
+_VIRGULE_EN_ESPACE = bytes.maketrans(b",", b" ")
+
+
+def chemin_cache(filename):
+    """Nom du fichier cache associe a une instance"""
+    return filename + SUFFIXE_CACHE
+
+
+def cache_valide(filename):
+    """Le cache existe et il est plus recent que l'instance"""
+    cache = chemin_cache(filename)
+    return os.path.exists(cache) and os.path.getmtime(cache) >= os.path.getmtime(filename)
+
+
+def _convertir(texte, filename):
+    """Bloc de lignes completes -> tableau (n, 2) de float64,
+    ValueError si une ligne n'est pas formee de deux nombres"""
+    try:
+        valeurs = np.fromstring(texte.translate(_VIRGULE_EN_ESPACE), sep=" ")
+    except ValueError as erreur:
+        raise ValueError(f"{filename} : ligne mal formee") from erreur
+    lignes = texte.count(b"\n") + (not texte.endswith(b"\n"))
+    if len(valeurs) != 2*lignes:
+        #Cas lent, seulement si des lignes sont vides
+        lignes = sum(1 for ligne in texte.splitlines() if ligne.strip())
+        if len(valeurs) != 2*lignes:
+            raise ValueError(f"{filename} : {len(valeurs)} nombres pour {lignes} lignes, "
+                             "il faut deux coordonnees par ligne")
+    return valeurs.reshape(-1, 2)
+
+
+def iterer_blocs(filename, taille_bloc=TAILLE_BLOC):
+    """Genere les coordonnees du fichier par blocs de forme (n, 2)"""
+    reste = b""
+    with open(filename, "rb") as instance_file:
+        while True:
+            bloc = instance_file.read(taille_bloc)
+            if not bloc:
+                break
+            bloc = reste + bloc
+            coupure = bloc.rfind(b"\n") + 1
+            reste = bloc[coupure:]
+            valeurs = _convertir(bloc[:coupure], filename)
+            if len(valeurs):
+                yield valeurs
+    if reste.strip():
+        yield _convertir(reste, filename)
+
+
+def ecrire_cache(filename, taille_bloc=TAILLE_BLOC):
+    """Convertit l'instance en cache binaire sans la garder en memoire"""
+    cache = chemin_cache(filename)
+    temporaire = cache + ".tmp"
+    try:
+        with open(temporaire, "wb") as cache_file:
+            for bloc in iterer_blocs(filename, taille_bloc):
+                bloc.tofile(cache_file)
+        os.replace(temporaire, cache)
+    except BaseException:
+        if os.path.exists(temporaire):
+            os.remove(temporaire)
+        raise
+    return cache
+
+
+def load_coordinates(filename, cache=True):
+    """
+    charge un fichier .pts.
+    retourne un tableau (N, 2) de float64 (projete en memoire si cache=True).
+    """
+    if cache and not cache_valide(filename):
+        try:
+            ecrire_cache(filename)
+        except OSError:
+            cache = False #Dossier en lecture seule ou disque plein
+    if not cache:
+        blocs = list(iterer_blocs(filename))
+        if not blocs:
+            return np.empty((0, 2))
+        return np.concatenate(blocs)
+    if os.path.getsize(chemin_cache(filename)) == 0:
+        return np.empty((0, 2))
+    return np.memmap(chemin_cache(filename), dtype=np.float64, mode="r").reshape(-1, 2)
@@ -7,6 +7,8 @@ from geo.point import Point
 from geo.tycat import tycat
 from geo.segment import Segment
 from time import time
+from closest_random import recherche_aleatoire
+from closest_parallel import recherche_parallele
 
 
 def load_instance(filename):
@@ -73,10 +75,28 @@ def find_rec(points):
     return ptmin
 
 
-def print_solution(points):
-    """Diviser pour regner"""
+def diviser_pour_regner(points):
+    """Tri par x puis find_rec"""
     points.sort(key = lambda  point : point.coordinates[0])
-    ptmin = find_rec(points)
+    return find_rec(points)
+
+
+#Algorithmes disponibles, choisis avec ./main.py --algo=nom instances...
+ALGORITHMES = {
+    "rec" : diviser_pour_regner,
+    "aleatoire" : recherche_aleatoire,
+    "parallele" : recherche_parallele,
+}
+ALGORITHME = "rec"
+
+
+def print_solution(points, algorithme=None):
+    """Diviser pour regner (ou l'algorithme choisi dans ALGORITHMES)"""
+    if algorithme is None:
+        algorithme = ALGORITHME
+    if algorithme not in ALGORITHMES:
+        raise ValueError(f"algorithme inconnu, choisir parmi {', '.join(ALGORITHMES)}")
+    ptmin = ALGORITHMES[algorithme](points)
     print(f"{ptmin[0].coordinates[0]}, {ptmin[0].coordinates[1]}; {ptmin[1].coordinates[0]}, {ptmin[1].coordinates[1]}")
 
 
@@ -90,3 +110,8 @@ def main():
         points = load_instance(instance)
         print_solution(points)
 
+
+if __name__ == "__main__":
+    if len(argv) > 1 and argv[1].startswith("--algo="):
+        ALGORITHME = argv.pop(1)[len("--algo="):]
+    main()